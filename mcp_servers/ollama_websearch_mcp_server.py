@@ -9,54 +9,166 @@ import httpx
 import os
 import asyncio
 import json
+import random
+from contextlib import asynccontextmanager
+from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
 from pathlib import Path
+from typing import Optional
 from dotenv import load_dotenv
 
 # Load environment variables
 env_path = Path(__file__).resolve().parents[1] / ".env"
 load_dotenv(env_path)
 
-mcp = FastMCP("ollama-web-search")
-
 API_KEY = os.getenv('OLLAMA_API_KEY')
 
 if not API_KEY:
     raise ValueError('OLLAMA_API_KEY environment variable is required')
 
+# Shared client so repeated tool calls reuse pooled keep-alive connections
+# instead of paying a fresh TCP + TLS handshake per request. The base URL and
+# Authorization header are configured once here, so each call only sends its
+# endpoint path and payload. HTTP/2 lets concurrent calls share a connection
+# as separate streams, so the pool can be much smaller than with HTTP/1.1.
+CLIENT = httpx.AsyncClient(
+    base_url='https://ollama.com',
+    headers={'Authorization': f'Bearer {API_KEY}'},
+    http2=True,
+    timeout=httpx.Timeout(30.0, connect=10.0),
+    limits=httpx.Limits(max_connections=10, max_keepalive_connections=10, keepalive_expiry=30.0)
+)
+
+
+# API endpoints, relative to the client's base_url
+WEB_SEARCH_PATH = '/api/web_search'
+WEB_FETCH_PATH = '/api/web_fetch'
+
+
+@asynccontextmanager
+async def lifespan(server: FastMCP):
+    """Close the shared HTTP client when the server shuts down."""
+    try:
+        yield
+    finally:
+        await CLIENT.aclose()
+
+
+mcp = FastMCP("ollama-web-search", lifespan=lifespan)
+
+# Retry backoff: decorrelated jitter between the base delay and 3x the
+# previous delay, capped per sleep and in total across all attempts
+RETRY_BASE_DELAY = 0.5
+RETRY_MAX_DELAY = 10.0
+RETRY_MAX_TOTAL_WAIT = 30.0
+
+
+def _retry_after_seconds(response: httpx.Response) -> Optional[float]:
+    """Parse a Retry-After header (delta-seconds or HTTP date) into seconds."""
+    value = response.headers.get('Retry-After')
+    if not value:
+        return None
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        pass
+    try:
+        retry_at = parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+    return max(0.0, (retry_at - datetime.now(timezone.utc)).total_seconds())
+
+
 async def make_api_request(url: str, payload: dict, max_retries: int = 3) -> dict:
     """Make API request with retry logic and error handling."""
+    delay = RETRY_BASE_DELAY
+    total_wait = 0.0
     for attempt in range(max_retries):
+        is_last_attempt = attempt == max_retries - 1
+        wait = None
         try:
-            async with httpx.AsyncClient(timeout=30.0) as client:
-                response = await client.post(
-                    url,
-                    headers={'Authorization': f'Bearer {API_KEY}'},
-                    json=payload
-                )
-                response.raise_for_status()
-                return response.json()
+            response = await CLIENT.post(url, json=payload)
+            response.raise_for_status()
+            return response.json()
         except httpx.TimeoutException:
-            if attempt == max_retries - 1:
+            if is_last_attempt:
                 raise Exception(f"Request timed out after {max_retries} attempts")
-            await asyncio.sleep(2 ** attempt)  # Exponential backoff
         except httpx.HTTPStatusError as e:
             if e.response.status_code == 429:  # Rate limit
-                if attempt == max_retries - 1:
+                if is_last_attempt:
                     raise Exception("Rate limit exceeded. Please try again later.")
-                await asyncio.sleep(5 * (attempt + 1))  # Longer wait for rate limits
+                # Honor the server's requested wait when it gives one
+                wait = _retry_after_seconds(e.response)
             elif e.response.status_code >= 500:  # Server error
-                if attempt == max_retries - 1:
+                if is_last_attempt:
                     raise Exception(f"Server error: {e.response.status_code}")
-                await asyncio.sleep(2 ** attempt)
             else:
                 raise Exception(f"API error: {e.response.status_code} - {e.response.text}")
-        except Exception as e:
-            if attempt == max_retries - 1:
+        except httpx.TransportError as e:
+            if is_last_attempt:
                 raise Exception(f"Request failed: {str(e)}")
-            await asyncio.sleep(2 ** attempt)
+
+        if wait is None:
+            delay = min(RETRY_MAX_DELAY, random.uniform(RETRY_BASE_DELAY, delay * 3))
+            wait = delay
+        if total_wait + wait > RETRY_MAX_TOTAL_WAIT:
+            raise Exception(
+                f"Retry budget of {RETRY_MAX_TOTAL_WAIT:.0f}s exhausted after {attempt + 1} attempts"
+            )
+        total_wait += wait
+        await asyncio.sleep(wait)
 
     raise Exception("All retry attempts failed")
 
+# Cap on in-flight requests for the batch tools (multiplexed over the HTTP/2 pool)
+MAX_CONCURRENT_REQUESTS = 20
+_request_semaphore = asyncio.Semaphore(MAX_CONCURRENT_REQUESTS)
+
+
+async def _limited_api_request(url: str, payload: dict) -> dict:
+    """Make an API request while holding a slot of the shared concurrency cap."""
+    async with _request_semaphore:
+        return await make_api_request(url, payload)
+
+
+def _format_search_results(query: str, data: dict, max_results: int) -> str:
+    """Format a web_search API response for display."""
+    # Parse and format the results
+    if 'results' in data and data['results']:
+        # Format results for better readability
+        formatted_results = []
+        for i, result in enumerate(data['results'][:max_results], 1):
+            formatted_results.append({
+                'rank': i,
+                'title': result.get('title', 'No title'),
+                'url': result.get('url', 'No URL'),
+                'content': result.get('content', 'No content')[:500] + '...' if len(result.get('content', '')) > 500 else result.get('content', 'No content')
+            })
+
+        return f"Search Results for: '{query}'\n\n" + "\n\n".join([
+            f"{result['rank']}. **{result['title']}**\n   URL: {result['url']}\n   Content: {result['content']}"
+            for result in formatted_results
+        ])
+    else:
+        return f"Search completed for: '{query}'\n\nNo results found or unexpected response format."
+
+
+def _format_fetch_result(url: str, data: dict) -> str:
+    """Format a web_fetch API response for display."""
+    title = data.get('title', 'No title available')
+    content = data.get('content', 'No content available')
+    links = data.get('links', [])
+
+    formatted_response = f"**Page Title:** {title}\n\n**URL:** {url}\n\n**Content:**\n{content[:2000]}{'...' if len(content) > 2000 else ''}"
+
+    if links:
+        formatted_response += f"\n\n**Links Found:** {len(links)}\n" + "\n".join(f"- {link}" for link in links[:10])
+        if len(links) > 10:
+            formatted_response += f"\n... and {len(links) - 10} more links"
+
+    return formatted_response
+
+
 @mcp.tool()
 async def web_search(query: str, max_results: int = 10) -> str:
     """Search the web using Ollama's web search API.
@@ -74,32 +186,45 @@ async def web_search(query: str, max_results: int = 10) -> str:
 
         # Make API request with retry logic
         data = await make_api_request(
-            'https://ollama.com/api/web_search',
+            WEB_SEARCH_PATH,
             {'query': query, 'max_results': max_results}
         )
 
-        # Parse and format the results
-        if 'results' in data and data['results']:
-            # Format results for better readability
-            formatted_results = []
-            for i, result in enumerate(data['results'][:max_results], 1):
-                formatted_results.append({
-                    'rank': i,
-                    'title': result.get('title', 'No title'),
-                    'url': result.get('url', 'No URL'),
-                    'content': result.get('content', 'No content')[:500] + '...' if len(result.get('content', '')) > 500 else result.get('content', 'No content')
-                })
-
-            return f"Search Results for: '{query}'\n\n" + "\n\n".join([
-                f"{result['rank']}. **{result['title']}**\n   URL: {result['url']}\n   Content: {result['content']}"
-                for result in formatted_results
-            ])
-        else:
-            return f"Search completed for: '{query}'\n\nNo results found or unexpected response format."
+        return _format_search_results(query, data, max_results)
 
     except Exception as e:
         return f"Error performing web search: {str(e)}"
 
+@mcp.tool()
+async def web_search_many(queries: list[str], max_results: int = 10) -> str:
+    """Run several web searches concurrently using Ollama's web search API.
+
+    Args:
+        queries: The search query strings
+        max_results: Maximum number of results per query (default: 10, max: 20)
+
+    Returns:
+        Formatted search results for each query, in the order given
+    """
+    # Validate and clamp max_results
+    max_results = max(1, min(max_results, 20))
+
+    results = await asyncio.gather(*[
+        _limited_api_request(
+            WEB_SEARCH_PATH,
+            {'query': query, 'max_results': max_results}
+        )
+        for query in queries
+    ], return_exceptions=True)
+
+    sections = []
+    for query, data in zip(queries, results):
+        if isinstance(data, Exception):
+            sections.append(f"Error performing web search for '{query}': {str(data)}")
+        else:
+            sections.append(_format_search_results(query, data, max_results))
+    return "\n\n---\n\n".join(sections)
+
 @mcp.tool()
 async def web_fetch(url: str) -> str:
     """Fetch content from a web page using Ollama's web fetch API.
@@ -117,26 +242,40 @@ async def web_fetch(url: str) -> str:
 
         # Make API request with retry logic
         data = await make_api_request(
-            'https://ollama.com/api/web_fetch',
+            WEB_FETCH_PATH,
             {'url': url}
         )
 
-        # Format the response
-        title = data.get('title', 'No title available')
-        content = data.get('content', 'No content available')
-        links = data.get('links', [])
+        return _format_fetch_result(url, data)
 
-        formatted_response = f"**Page Title:** {title}\n\n**URL:** {url}\n\n**Content:**\n{content[:2000]}{'...' if len(content) > 2000 else ''}"
+    except Exception as e:
+        return f"Error fetching webpage: {str(e)}"
 
-        if links:
-            formatted_response += f"\n\n**Links Found:** {len(links)}\n" + "\n".join(f"- {link}" for link in links[:10])
-            if len(links) > 10:
-                formatted_response += f"\n... and {len(links) - 10} more links"
+@mcp.tool()
+async def web_fetch_many(urls: list[str]) -> str:
+    """Fetch several web pages concurrently using Ollama's web fetch API.
 
-        return formatted_response
+    Args:
+        urls: The URLs of the webpages to fetch
 
-    except Exception as e:
-        return f"Error fetching webpage: {str(e)}"
+    Returns:
+        Formatted page content for each URL, in the order given
+    """
+    async def fetch(url: str):
+        # Basic URL validation
+        if not url.startswith(('http://', 'https://')):
+            raise ValueError("URL must start with http:// or https://")
+        return await _limited_api_request(WEB_FETCH_PATH, {'url': url})
+
+    results = await asyncio.gather(*[fetch(url) for url in urls], return_exceptions=True)
+
+    sections = []
+    for url, data in zip(urls, results):
+        if isinstance(data, Exception):
+            sections.append(f"Error fetching webpage {url}: {str(data)}")
+        else:
+            sections.append(_format_fetch_result(url, data))
+    return "\n\n---\n\n".join(sections)
 
 if __name__ == "__main__":
     mcp.run(transport='stdio')
@@ -1,11 +1,23 @@
 """
 PDF Extractor MCP Server using FastMCP
-An MCP server that uses the pypdf library to extract text from PDF files and format it as Markdown.
+An MCP server that uses the PyMuPDF library to extract text from PDF files and format it as Markdown.
 Can be run as a standalone stdio server or integrated with CrewAI tools.
 """
 
+import asyncio
+import hashlib
+import io
+import multiprocessing
+import os
+import re
+import shutil
 import sys
+import threading
+from concurrent.futures import ProcessPoolExecutor
+from contextlib import asynccontextmanager
+from functools import lru_cache, partial
 from pathlib import Path
+from typing import Any, Dict, Iterator, List, Optional, Tuple
 from urllib.parse import urlparse
 import tempfile
 import logging
@@ -23,6 +35,29 @@ except ImportError:
             "FastMCP is not available. Please install with: pip install fastmcp"
         ) from e
 
+@lru_cache(maxsize=1)
+def _get_http_session():
+    """
+    Get the shared HTTP session used for PDF downloads.
+    
+    The session keeps connections alive between downloads, so repeated
+    fetches from the same host skip the TCP + TLS handshake. Raises
+    ImportError if requests is not installed.
+    """
+    import requests
+    from requests.adapters import HTTPAdapter
+    
+    session = requests.Session()
+    adapter = HTTPAdapter(pool_connections=10, pool_maxsize=20)
+    session.mount('http://', adapter)
+    session.mount('https://', adapter)
+    return session
+
+
+# Read size used when streaming downloads to disk
+DOWNLOAD_CHUNK_SIZE = 64 * 1024
+
+
 # Simple file download utility (replaces mcp.util.file_util.download_file)
 def download_file(file_url_or_path: str) -> str:
     """
@@ -50,40 +85,200 @@ def download_file(file_url_or_path: str) -> str:
     # If it's a URL (http/https), download it
     if parsed.scheme in ('http', 'https'):
         try:
-            import requests
-            response = requests.get(file_url_or_path, timeout=30)
-            response.raise_for_status()
-            
-            # Save to temporary file
+            session = _get_http_session()
             suffix = Path(parsed.path).suffix or '.pdf'
-            with tempfile.NamedTemporaryFile(delete=False, suffix=suffix) as tmp_file:
-                tmp_file.write(response.content)
-                return tmp_file.name
+            
+            # Stream the body to a temporary file instead of buffering it in memory
+            with session.get(file_url_or_path, timeout=30, stream=True) as response:
+                response.raise_for_status()
+                # Undo any Content-Encoding while copying straight from the socket
+                response.raw.decode_content = True
+                with tempfile.NamedTemporaryFile(delete=False, suffix=suffix) as tmp_file:
+                    shutil.copyfileobj(response.raw, tmp_file, length=DOWNLOAD_CHUNK_SIZE)
+                    return tmp_file.name
         except ImportError:
             # Fallback to urllib if requests not available
-            from urllib.request import urlretrieve
+            from urllib.request import urlopen
             suffix = Path(parsed.path).suffix or '.pdf'
-            tmp_file, _ = urlretrieve(file_url_or_path)
-            return tmp_file
+            with urlopen(file_url_or_path, timeout=30) as response:
+                with tempfile.NamedTemporaryFile(delete=False, suffix=suffix) as tmp_file:
+                    shutil.copyfileobj(response, tmp_file, length=DOWNLOAD_CHUNK_SIZE)
+                    return tmp_file.name
     
     # Unknown scheme
     raise ValueError(f"Unsupported file scheme: {parsed.scheme} (file: {file_url_or_path})")
 
-try:
-    from pypdf import PdfReader
-except ImportError as e:
-    raise ImportError(
-        "pypdf is not available. Please install with: pip install pypdf"
-    ) from e
+@lru_cache(maxsize=1)
+def _get_pymupdf():
+    """
+    Import PyMuPDF on first use.
+    
+    Deferring the import keeps server start-up cheap; the stdio process is
+    spawned per agent run and may exit without extracting anything.
+    """
+    try:
+        import pymupdf
+    except ImportError as e:
+        raise ImportError(
+            "PyMuPDF is not available. Please install with: pip install pymupdf"
+        ) from e
+    return pymupdf
+
+
+@lru_cache(maxsize=1)
+def _text_extraction_flags() -> int:
+    """
+    Text-only extraction flags: image blocks and vector paths are never
+    collected, so graphics-heavy pages cost only content-stream interpretation.
+    """
+    pymupdf = _get_pymupdf()
+    return pymupdf.TEXTFLAGS_TEXT & ~(
+        pymupdf.TEXT_PRESERVE_IMAGES | pymupdf.TEXT_COLLECT_VECTORS
+    )
+
+@asynccontextmanager
+async def lifespan(server: FastMCP):
+    """Shut down the page-extraction process pool when the server shuts down."""
+    try:
+        yield
+    finally:
+        await asyncio.to_thread(_shutdown_process_pool)
+
 
 # Initialize the FastMCP server with a unique name
 mcp_server = FastMCP(
     name="pypdf-extractor",
-    instructions="An MCP server that uses the pypdf library to extract text from PDF files and format it as Markdown.",
-    version="0.1.0"
+    instructions="An MCP server that uses the PyMuPDF library to extract text from PDF files and format it as Markdown.",
+    version="0.1.0",
+    lifespan=lifespan
 )
 
 
+def _resolve_pdf_path(file_url_or_path: str) -> str:
+    """
+    Resolve a relative PDF path against the project root and data/ directory.
+    
+    Args:
+        file_url_or_path: The local file path or a public URL to the PDF file
+        
+    Returns:
+        The resolved path, or the input unchanged if no match was found
+    """
+    file_path_obj = Path(file_url_or_path)
+    
+    # If it's not an absolute path and doesn't exist, try relative to project root
+    if not file_path_obj.is_absolute() and not file_path_obj.exists():
+        # Try project root and data directory
+        project_root = Path(__file__).parent.parent
+        data_dir = project_root / "data"
+        
+        # Try project root first
+        potential_path = project_root / file_url_or_path
+        if potential_path.exists():
+            file_url_or_path = str(potential_path)
+            logger.debug(f"Found file at project root: {file_url_or_path}")
+        # Try data directory
+        elif (data_dir / file_url_or_path).exists():
+            file_url_or_path = str(data_dir / file_url_or_path)
+            logger.debug(f"Found file in data directory: {file_url_or_path}")
+    
+    return file_url_or_path
+
+
+def _local_pdf_path(file_url_or_path: str) -> str:
+    """
+    Return a local path for an already-resolved PDF path or URL.
+    
+    Existing local files short-circuit the scheme checks in download_file;
+    everything else (URLs, missing files) is delegated to it unchanged.
+    """
+    path = Path(file_url_or_path)
+    if path.is_file():
+        return str(path.resolve())
+    return download_file(file_url_or_path)
+
+
+# On-disk cache of extracted markdown, keyed by a hash of the PDF bytes
+MARKDOWN_CACHE_DIR = Path(tempfile.gettempdir()) / "pdf_md_cache"
+# Oldest entries are evicted once the cache grows beyond this size
+MARKDOWN_CACHE_MAX_BYTES = 1024 ** 3
+# Bump whenever the markdown format changes so stale entries are ignored
+MARKDOWN_CACHE_VERSION = 2
+
+
+def _file_digest(path: str) -> str:
+    """
+    Hash a file's content (plus the cache format version) in 1 MiB chunks.
+    
+    Args:
+        path: Local path to the file
+        
+    Returns:
+        Hex digest used as the cache key
+    """
+    digest = hashlib.blake2b(digest_size=16)
+    digest.update(f"v{MARKDOWN_CACHE_VERSION}:".encode())
+    with open(path, 'rb') as f:
+        for block in iter(partial(f.read, 1024 * 1024), b''):
+            digest.update(block)
+    return digest.hexdigest()
+
+
+def _read_cached_markdown(cache_key: str) -> Optional[str]:
+    """Return cached markdown for a key, or None on a cache miss."""
+    cache_path = MARKDOWN_CACHE_DIR / f"{cache_key}.md"
+    try:
+        markdown = cache_path.read_text(encoding="utf-8")
+        # Refresh mtime so eviction is least-recently-used
+        os.utime(cache_path)
+        return markdown
+    except OSError:
+        return None
+
+
+def _write_cached_markdown(cache_key: str, markdown: str) -> None:
+    """
+    Store markdown in the cache atomically, then enforce the size cap.
+    
+    Cache failures are logged and otherwise ignored; they never affect
+    the extraction result.
+    """
+    try:
+        MARKDOWN_CACHE_DIR.mkdir(parents=True, exist_ok=True)
+        with tempfile.NamedTemporaryFile(
+            "w", encoding="utf-8", dir=MARKDOWN_CACHE_DIR, suffix=".tmp", delete=False
+        ) as tmp_file:
+            tmp_file.write(markdown)
+        os.replace(tmp_file.name, MARKDOWN_CACHE_DIR / f"{cache_key}.md")
+        _prune_markdown_cache()
+    except OSError as e:
+        logger.warning(f"Failed to write markdown cache entry {cache_key}: {e}")
+
+
+def _prune_markdown_cache() -> None:
+    """Delete the least recently used entries while the cache exceeds its size cap."""
+    entries = []
+    total_bytes = 0
+    with os.scandir(MARKDOWN_CACHE_DIR) as it:
+        for entry in it:
+            if entry.name.endswith(".md"):
+                stat = entry.stat()
+                entries.append((stat.st_mtime, stat.st_size, entry.path))
+                total_bytes += stat.st_size
+    
+    if total_bytes <= MARKDOWN_CACHE_MAX_BYTES:
+        return
+    
+    for _, size, path in sorted(entries):
+        try:
+            os.remove(path)
+        except OSError:
+            continue
+        total_bytes -= size
+        if total_bytes <= MARKDOWN_CACHE_MAX_BYTES:
+            break
+
+
 def _extract_pdf_markdown_impl(file_url_or_path: str) -> str:
     """
     Extracts all text content from a PDF file specified by a local path or a remote URL, 
@@ -101,97 +296,45 @@ def _extract_pdf_markdown_impl(file_url_or_path: str) -> str:
     logger.debug(f"Attempting to process file: {file_url_or_path}")
     print(f"Attempting to process file: {file_url_or_path}", file=sys.stderr)
     try:
-        # Handle relative paths - check if it's a relative path first
-        file_path_obj = Path(file_url_or_path)
-        
-        # If it's not an absolute path and doesn't exist, try relative to project root
-        if not file_path_obj.is_absolute() and not file_path_obj.exists():
-            # Try project root and data directory
-            project_root = Path(__file__).parent.parent
-            data_dir = project_root / "data"
-            
-            # Try project root first
-            potential_path = project_root / file_url_or_path
-            if potential_path.exists():
-                file_url_or_path = str(potential_path)
-                logger.debug(f"Found file at project root: {file_url_or_path}")
-            # Try data directory
-            elif (data_dir / file_url_or_path).exists():
-                file_url_or_path = str(data_dir / file_url_or_path)
-                logger.debug(f"Found file in data directory: {file_url_or_path}")
-        
-        # Use download_file to handle both local paths and remote URLs
-        # This function downloads the file and returns the local path to the temp file
+        # Handle relative paths (project root, then data/ directory)
+        file_url_or_path = _resolve_pdf_path(file_url_or_path)
+        
+        # Existing local files are used in place; only URLs (and paths that
+        # need an error message) go through download_file
         try:
-            local_path = download_file(file_url_or_path)
+            local_path = _local_pdf_path(file_url_or_path)
             logger.debug(f"File resolved to: {local_path}")
         except FileNotFoundError as e:
             error_msg = f"Error: PDF file not found at path or URL: {file_url_or_path}"
             logger.error(error_msg)
             return error_msg
         
+        # Extraction is a pure function of the file content, so a cached
+        # result for the same bytes can be returned without re-parsing
+        cache_key = _file_digest(local_path)
+        cached = _read_cached_markdown(cache_key)
+        if cached is not None:
+            logger.debug(f"Returning cached markdown for {local_path} ({cache_key})")
+            return cached
+        
         # Read the PDF content
         try:
-            reader = PdfReader(local_path)
-            logger.debug(f"PDF reader created successfully, checking pages...")
+            doc = _get_pymupdf().open(local_path)
+            logger.debug(f"PDF document opened successfully, checking pages...")
         except Exception as e:
             error_msg = f"Error: Failed to read PDF file: {str(e)}. The file may be corrupted or not a valid PDF."
             logger.error(error_msg, exc_info=True)
             return error_msg
         
-        if len(reader.pages) == 0:
-            error_msg = "Error: PDF file appears to be empty (no pages found)"
-            logger.error(error_msg)
-            return error_msg
-        
-        logger.debug(f"PDF has {len(reader.pages)} pages, extracting text...")
-        markdown_output = []
-        pages_with_text = 0
-        
-        # Iterate over all pages and extract text
-        for i, page in enumerate(reader.pages):
-            try:
-                page_text = page.extract_text()
-                
-                # Simple Markdown formatting: Page heading and content
-                markdown_output.append(f"## Page {i + 1}")
-                
-                # Replace common multiple newlines with single ones for cleaner Markdown
-                clean_text = page_text.replace('\n\n', '\n').strip()
-                if clean_text:  # Only add non-empty pages
-                    markdown_output.append(clean_text)
-                    markdown_output.append("\n---\n")  # Separator between pages
-                    pages_with_text += 1
-            except Exception as e:
-                # If a single page fails, log and continue
-                logger.warning(f"Failed to extract text from page {i + 1}: {e}")
-                print(f"Warning: Failed to extract text from page {i + 1}: {e}", file=sys.stderr)
-                markdown_output.append(f"## Page {i + 1}")
-                markdown_output.append(f"[Error extracting text from this page: {str(e)}]")
-                markdown_output.append("\n---\n")
-        
-        # Check if we extracted any text
-        full_text = "\n".join(markdown_output)
-        # Remove page headers and separators to check actual content
-        content_text = full_text.replace("## Page", "").replace("---", "").replace("[Error extracting text from this page:", "").strip()
-        
-        # Validate extracted content before returning
-        if not content_text or len(content_text) < 10:
-            error_msg = "Error: Could not extract any readable text from the PDF. The PDF may contain only images or be encrypted."
-            logger.error(f"{error_msg} (extracted {pages_with_text} pages with text, total length: {len(content_text)})")
-            return error_msg
-        
-        logger.info(f"Successfully extracted text from PDF: {len(reader.pages)} pages, {pages_with_text} pages with content, {len(full_text)} total characters")
-        logger.debug(f"Extracted content preview (first 200 chars): {full_text[:200]}")
-        
-        # Final validation: ensure the content doesn't look like an error message
-        # (though all error messages should start with "Error:", this is a safety check)
-        if full_text.strip().startswith("Error:"):
-            logger.warning(f"Extracted content appears to be an error message: {full_text[:200]}")
-            return full_text  # Return as-is since it's already formatted as an error
+        try:
+            markdown = _extract_document_markdown(doc)
+        finally:
+            # Release the underlying file handle / mmap
+            doc.close()
         
-        # Join all parts to form the final Markdown string
-        return full_text
+        if not markdown.startswith("Error:"):
+            _write_cached_markdown(cache_key, markdown)
+        return markdown
     
     except FileNotFoundError as e:
         error_msg = f"Error: PDF file not found at path or URL: {file_url_or_path}"
@@ -210,8 +353,319 @@ def _extract_pdf_markdown_impl(file_url_or_path: str) -> str:
         return f"Error: An unexpected error occurred during PDF processing: {error_type}: {error_msg}"
 
 
-# Register the function as a tool with FastMCP (for MCP server usage)
-mcp_server.tool()(_extract_pdf_markdown_impl)
+# Page text cleanup, compiled once: form feeds become newlines, NULs are dropped,
+# and any run of two or more newlines collapses to one
+_PAGE_TEXT_TRANSLATION = str.maketrans({'\f': '\n', '\x00': None})
+_MULTI_NEWLINE_RE = re.compile(r'\n{2,}')
+
+# Documents with fewer pages are extracted serially (worker startup would dominate)
+PARALLEL_MIN_PAGES = 16
+# Number of consecutive pages handed to a worker process per task
+PAGES_PER_TASK = 8
+
+# Page-extraction worker pool, shared by all requests and created on first use
+_process_pool: Optional[ProcessPoolExecutor] = None
+_process_pool_lock = threading.Lock()
+
+
+def _get_process_pool() -> ProcessPoolExecutor:
+    """
+    Get the shared page-extraction process pool, creating it on first use.
+    
+    Workers are spawned rather than forked: extraction is called from
+    executor threads of the asyncio server, and forking a multithreaded
+    process can leave children stuck on locks held at fork time.
+    """
+    global _process_pool
+    with _process_pool_lock:
+        if _process_pool is None:
+            _process_pool = ProcessPoolExecutor(mp_context=multiprocessing.get_context("spawn"))
+        return _process_pool
+
+
+def _shutdown_process_pool() -> None:
+    """Shut down the shared process pool, if it was started."""
+    global _process_pool
+    with _process_pool_lock:
+        pool, _process_pool = _process_pool, None
+    if pool is not None:
+        pool.shutdown()
+
+
+def _extract_page_range(path: str, start: int, stop: int) -> List[Tuple[Optional[str], Optional[str]]]:
+    """
+    Extract the text of pages [start, stop) in a worker process.
+    
+    Args:
+        path: Local path to the PDF file
+        start: Index of the first page to extract
+        stop: Index one past the last page to extract
+        
+    Returns:
+        A (text, error) pair per page; exactly one of the two is None
+    """
+    results = []
+    flags = _text_extraction_flags()
+    with _get_pymupdf().open(path) as doc:
+        for page_idx in range(start, stop):
+            try:
+                results.append((doc[page_idx].get_text("text", flags=flags), None))
+            except Exception as e:
+                results.append((None, str(e)))
+    return results
+
+
+def _iter_page_texts(doc: "pymupdf.Document") -> Iterator[Tuple[Optional[str], Optional[str]]]:
+    """
+    Yield a (text, error) pair for each page of the document, in page order.
+    
+    Large documents opened from disk are split into page ranges and
+    extracted in parallel by a process pool; small or in-memory documents
+    are extracted serially in this process.
+    """
+    page_count = doc.page_count
+    if page_count < PARALLEL_MIN_PAGES or not doc.name:
+        flags = _text_extraction_flags()
+        for page in doc:
+            try:
+                yield page.get_text("text", flags=flags), None
+            except Exception as e:
+                yield None, str(e)
+        return
+    
+    starts = range(0, page_count, PAGES_PER_TASK)
+    stops = [min(start + PAGES_PER_TASK, page_count) for start in starts]
+    # map() returns results in submission order, so pages stay ordered
+    for page_results in _get_process_pool().map(partial(_extract_page_range, doc.name), starts, stops):
+        yield from page_results
+
+
+def _iter_page_markdown(doc: "pymupdf.Document", stats: Dict[str, int]) -> Iterator[str]:
+    """
+    Yield the Markdown for each page of an opened PDF document.
+    
+    Concatenating the yielded chunks produces the full document, so callers
+    can stream pages out without holding the whole text in memory.
+    
+    Args:
+        doc: An open PyMuPDF document
+        stats: Counters updated while iterating ("pages_with_text", "content_chars")
+        
+    Yields:
+        Markdown for one page, prefixed with a newline after the first page
+    """
+    stats.setdefault("pages_with_text", 0)
+    stats.setdefault("content_chars", 0)
+    
+    for i, (page_text, error) in enumerate(_iter_page_texts(doc)):
+        # Pages are joined by a single newline, as before
+        prefix = "\n" if i else ""
+        if error is not None:
+            # If a single page fails, log and continue
+            logger.warning(f"Failed to extract text from page {i + 1}: {error}")
+            print(f"Warning: Failed to extract text from page {i + 1}: {error}", file=sys.stderr)
+            yield f"{prefix}## Page {i + 1}\n[Error extracting text from this page: {error}]\n\n---\n"
+            continue
+        
+        # Normalize form feeds / NULs, then collapse runs of blank lines for cleaner Markdown
+        clean_text = _MULTI_NEWLINE_RE.sub('\n', page_text.translate(_PAGE_TEXT_TRANSLATION)).strip()
+        if clean_text:  # Only add non-empty pages
+            stats["pages_with_text"] += 1
+            stats["content_chars"] += len(clean_text)
+            # Simple Markdown formatting: Page heading, content and separator
+            yield f"{prefix}## Page {i + 1}\n{clean_text}\n\n---\n"
+        else:
+            yield f"{prefix}## Page {i + 1}"
+
+
+def _extract_document_markdown(doc: "pymupdf.Document") -> str:
+    """
+    Extract the text of an opened PDF document and format it as Markdown.
+
+    Args:
+        doc: An open PyMuPDF document
+
+    Returns:
+        The extracted text formatted as Markdown, or an "Error:" message.
+    """
+    page_count = doc.page_count
+    if page_count == 0:
+        error_msg = "Error: PDF file appears to be empty (no pages found)"
+        logger.error(error_msg)
+        return error_msg
+    
+    logger.debug(f"PDF has {page_count} pages, extracting text...")
+    stats: Dict[str, int] = {}
+    
+    # Write pages incrementally instead of collecting a list of fragments
+    buffer = io.StringIO()
+    for chunk in _iter_page_markdown(doc, stats):
+        buffer.write(chunk)
+    pages_with_text = stats["pages_with_text"]
+    content_chars = stats["content_chars"]
+    
+    # Validate extracted content before returning (page headers and
+    # separators are not counted as content)
+    if content_chars < 10:
+        error_msg = "Error: Could not extract any readable text from the PDF. The PDF may contain only images or be encrypted."
+        logger.error(f"{error_msg} (extracted {pages_with_text} pages with text, total length: {content_chars})")
+        return error_msg
+    
+    full_text = buffer.getvalue()
+    logger.info(f"Successfully extracted text from PDF: {page_count} pages, {pages_with_text} pages with content, {len(full_text)} total characters")
+    logger.debug(f"Extracted content preview (first 200 chars): {full_text[:200]}")
+    
+    # Final validation: ensure the content doesn't look like an error message
+    # (though all error messages should start with "Error:", this is a safety check).
+    # Only the head is inspected so the whole document is not copied by strip()
+    if full_text[:64].lstrip().startswith("Error:"):
+        logger.warning(f"Extracted content appears to be an error message: {full_text[:200]}")
+        return full_text  # Return as-is since it's already formatted as an error
+    
+    return full_text
+
+
+# Documents with fewer pages than this are extracted through the cached
+# string path; larger ones are streamed to the output file page by page
+STREAM_TO_FILE_MIN_PAGES = 20
+
+
+def _extract_pdf_markdown_to_file_impl(file_url_or_path: str, out_path: Optional[str] = None) -> Dict[str, Any]:
+    """
+    Extract a PDF as Markdown into a file instead of returning the text.
+    
+    Args:
+        file_url_or_path: The local file path or a public URL to the PDF file
+        out_path: Destination file; a temporary .md file is created if omitted
+        
+    Returns:
+        Dictionary with the output path, page count and size in bytes, or
+        an error message
+    """
+    logger.debug(f"Attempting to process file to disk: {file_url_or_path}")
+    try:
+        file_url_or_path = _resolve_pdf_path(file_url_or_path)
+        try:
+            local_path = _local_pdf_path(file_url_or_path)
+        except FileNotFoundError:
+            return {
+                "error": f"PDF file not found at path or URL: {file_url_or_path}",
+                "success": False
+            }
+        
+        try:
+            doc = _get_pymupdf().open(local_path)
+        except Exception as e:
+            return {
+                "error": f"Failed to read PDF file: {str(e)}. The file may be corrupted or not a valid PDF.",
+                "success": False
+            }
+        
+        created_out_file = out_path is None
+        succeeded = False
+        with doc:
+            if created_out_file:
+                with tempfile.NamedTemporaryFile(delete=False, suffix=".md") as tmp_file:
+                    out_path = tmp_file.name
+            try:
+                error = None
+                page_count = doc.page_count
+                if page_count >= STREAM_TO_FILE_MIN_PAGES:
+                    # Large documents: write each page as it is extracted, so the
+                    # full text is never held in memory
+                    stats: Dict[str, int] = {}
+                    with open(out_path, "w", encoding="utf-8") as out_file:
+                        for chunk in _iter_page_markdown(doc, stats):
+                            out_file.write(chunk)
+                    if stats["content_chars"] < 10:
+                        error = "Could not extract any readable text from the PDF. The PDF may contain only images or be encrypted."
+                else:
+                    # Small documents: go through the markdown cache like the
+                    # string path, extracting from the already open document on a miss
+                    cache_key = _file_digest(local_path)
+                    markdown = _read_cached_markdown(cache_key)
+                    if markdown is None:
+                        markdown = _extract_document_markdown(doc)
+                        if not markdown.startswith("Error:"):
+                            _write_cached_markdown(cache_key, markdown)
+                    if markdown.startswith("Error:"):
+                        error = markdown[len("Error:"):].strip()
+                    else:
+                        with open(out_path, "w", encoding="utf-8") as out_file:
+                            out_file.write(markdown)
+                
+                if error is not None:
+                    return {"error": error, "success": False}
+                
+                result = {
+                    "path": out_path,
+                    "pages": page_count,
+                    "bytes": os.path.getsize(out_path),
+                    "success": True
+                }
+                succeeded = True
+                return result
+            finally:
+                # Don't leave a partial or empty temporary file behind on any failure
+                if created_out_file and not succeeded:
+                    try:
+                        os.remove(out_path)
+                    except OSError:
+                        pass
+    
+    except Exception as e:
+        logger.error(f"Error extracting PDF to file: {e}", exc_info=True)
+        return {
+            "error": f"An unexpected error occurred during PDF processing: {type(e).__name__}: {str(e)}",
+            "success": False
+        }
+
+
+async def extract_pdf_markdown_async(file_url_or_path: str) -> str:
+    """
+    Extracts all text content from a PDF file specified by a local path or a remote URL, 
+    and formats the output as simple Markdown.
+
+    Args:
+        file_url_or_path: The local file path or a public URL to the PDF file.
+                         Can be absolute or relative to project root.
+                         For relative paths, will check data/ directory first.
+
+    Returns:
+        The extracted PDF text content formatted as Markdown.
+    """
+    # Download and extraction block for seconds on large PDFs; run them in the
+    # default thread pool so the server's event loop keeps serving other calls
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(None, _extract_pdf_markdown_impl, file_url_or_path)
+
+
+# Register the async wrapper as a tool with FastMCP (for MCP server usage),
+# keeping the original tool name for existing clients
+mcp_server.tool(name="_extract_pdf_markdown_impl")(extract_pdf_markdown_async)
+
+
+async def extract_pdf_markdown_to_file_async(file_url_or_path: str, out_path: Optional[str] = None) -> Dict[str, Any]:
+    """
+    Extracts all text content from a PDF file as Markdown and writes it to a file,
+    returning only the output path and statistics instead of the full text.
+    Prefer this over _extract_pdf_markdown_impl for large documents.
+
+    Args:
+        file_url_or_path: The local file path or a public URL to the PDF file.
+                         Can be absolute or relative to project root.
+        out_path: Path of the Markdown file to write. A temporary file is
+                  created when omitted.
+
+    Returns:
+        A dictionary with "path", "pages", "bytes" and "success" keys, or
+        "error" and "success" on failure.
+    """
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(None, _extract_pdf_markdown_to_file_impl, file_url_or_path, out_path)
+
+
+mcp_server.tool(name="extract_pdf_markdown_to_file")(extract_pdf_markdown_to_file_async)
 
 # Export the actual implementation function for direct use (not through MCP)
 def extract_pdf_markdown(file_url_or_path: str) -> str:
@@ -225,6 +679,37 @@ def extract_pdf_markdown(file_url_or_path: str) -> str:
     return _extract_pdf_markdown_impl(file_url_or_path)
 
 
+def iter_pdf_markdown(file_url_or_path: str) -> Iterator[str]:
+    """
+    Stream PDF markdown page by page (bypassing MCP tool wrapper).
+    
+    Peak memory is bounded to a single page, which makes this the preferred
+    entry point for very large documents. Unlike extract_pdf_markdown, errors
+    are raised instead of being returned as "Error:" strings.
+    
+    Args:
+        file_url_or_path: The local file path or a public URL to the PDF file
+        
+    Yields:
+        Markdown chunks whose concatenation is the full document
+    """
+    local_path = _local_pdf_path(_resolve_pdf_path(file_url_or_path))
+    doc = _get_pymupdf().open(local_path)
+    try:
+        yield from _iter_page_markdown(doc, {})
+    finally:
+        doc.close()
+
+
+def extract_pdf_markdown_to_file(file_url_or_path: str, out_path: Optional[str] = None) -> Dict[str, Any]:
+    """
+    Extract PDF markdown into a file directly (bypassing MCP tool wrapper).
+    
+    Returns the output path and statistics rather than the text itself.
+    """
+    return _extract_pdf_markdown_to_file_impl(file_url_or_path, out_path)
+
+
 def get_server() -> FastMCP:
     """
     Get the FastMCP server instance.
@@ -1,23 +1,40 @@
 """
 PDF MCP Server Wrapper
-Creates a simple local PDF MCP server using PyPDF2 for text extraction
+Creates a simple local PDF MCP server using PyMuPDF for text extraction
 This implements MCP protocol for PDF reading capabilities
 """
 
 import os
 import sys
 import json
+import threading
+from functools import lru_cache
 from pathlib import Path
 from typing import Dict, Any, Optional
-import PyPDF2
 import logging
 
 logger = logging.getLogger(__name__)
 
 
+# PyMuPDF documents must not be used from several threads at once
+_document_lock = threading.Lock()
+
+
+@lru_cache(maxsize=8)
+def _open_document(path: str, mtime_ns: int) -> "pymupdf.Document":
+    """
+    Open a PDF document, reusing the parsed document on repeat reads.
+    
+    The file's modification time is part of the cache key, so editing
+    the file forces a fresh parse.
+    """
+    import pymupdf
+    return pymupdf.open(path)
+
+
 class PDFMCPServer:
     """
-    Simple PDF MCP Server implementation using PyPDF2
+    Simple PDF MCP Server implementation using PyMuPDF
     Provides PDF text extraction capabilities via MCP protocol
     """
     
@@ -36,6 +53,14 @@ class PDFMCPServer:
         Returns:
             Dictionary with extracted text and metadata
         """
+        # Imported here so listing files never pays for loading PyMuPDF
+        import pymupdf
+        
+        # Text-only extraction flags: image blocks and vector paths are never collected
+        text_flags = pymupdf.TEXTFLAGS_TEXT & ~(
+            pymupdf.TEXT_PRESERVE_IMAGES | pymupdf.TEXT_COLLECT_VECTORS
+        )
+        
         try:
             pdf_path = Path(file_path)
             
@@ -51,18 +76,21 @@ class PDFMCPServer:
                     "success": False
                 }
             
-            # Extract text from PDF
-            text = ""
+            # Extract text from PDF (collect fragments and join once instead
+            # of growing one string per page)
+            parts = []
             page_count = 0
             
-            with open(pdf_path, 'rb') as file:
-                pdf_reader = PyPDF2.PdfReader(file)
-                page_count = len(pdf_reader.pages)
+            mtime_ns = pdf_path.stat().st_mtime_ns
+            with _document_lock:
+                doc = _open_document(str(pdf_path.resolve()), mtime_ns)
+                page_count = doc.page_count
                 
-                for page_num, page in enumerate(pdf_reader.pages, 1):
-                    page_text = page.extract_text()
-                    text += f"\n--- Page {page_num} ---\n"
-                    text += page_text + "\n"
+                for page_num, page in enumerate(doc, 1):
+                    page_text = page.get_text("text", flags=text_flags)
+                    parts.append(f"\n--- Page {page_num} ---\n")
+                    parts.append(page_text + "\n")
+            text = "".join(parts)
             
             return {
                 "success": True,
@@ -73,7 +101,7 @@ class PDFMCPServer:
                 "character_count": len(text)
             }
             
-        except PyPDF2.errors.PdfReadError as e:
+        except pymupdf.FileDataError as e:
             return {
                 "error": f"Failed to read PDF: {str(e)}",
                 "success": False
@@ -96,22 +124,18 @@ class PDFMCPServer:
             Dictionary with list of PDF files
         """
         try:
-            dir_path = Path(directory)
-            if not dir_path.exists():
-                return {
-                    "error": f"Directory not found: {directory}",
-                    "success": False
-                }
-            
-            pdf_files = [
-                {
-                    "name": f.name,
-                    "path": str(f),
-                    "size": f.stat().st_size
-                }
-                for f in dir_path.iterdir()
-                if f.is_file() and f.suffix.lower() == '.pdf'
-            ]
+            # scandir entries carry cached type/stat info, avoiding a
+            # separate stat() syscall and Path object per file
+            with os.scandir(directory) as entries:
+                pdf_files = [
+                    {
+                        "name": entry.name,
+                        "path": entry.path,
+                        "size": entry.stat().st_size
+                    }
+                    for entry in entries
+                    if entry.is_file() and entry.name.lower().endswith('.pdf')
+                ]
             
             return {
                 "success": True,
@@ -119,6 +143,11 @@ class PDFMCPServer:
                 "count": len(pdf_files)
             }
             
+        except FileNotFoundError:
+            return {
+                "error": f"Directory not found: {directory}",
+                "success": False
+            }
         except Exception as e:
             logger.error(f"Error listing files: {e}")
             return {
@@ -127,14 +156,12 @@ class PDFMCPServer:
             }
 
 
-# Singleton instance
-_pdf_mcp_server = None
+# Shared instance, created once at import (construction is trivial, and
+# module import is already thread-safe)
+PDF_MCP_SERVER = PDFMCPServer()
 
 
 def get_pdf_mcp_server() -> PDFMCPServer:
-    """Get singleton PDF MCP Server instance"""
-    global _pdf_mcp_server
-    if _pdf_mcp_server is None:
-        _pdf_mcp_server = PDFMCPServer()
-    return _pdf_mcp_server
+    """Get the shared PDF MCP Server instance"""
+    return PDF_MCP_SERVER
 
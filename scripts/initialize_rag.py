@@ -41,6 +41,9 @@ sys.path.insert(0, str(project_root / "src"))
 from policy_navigator.retrieval.document_processor import DocumentProcessor
 from policy_navigator.retrieval.vector_store import get_vector_store
 
+# Number of chunks embedded and added to the vector store per batch
+INDEX_BATCH_SIZE = 128
+
 
 def main():
     """Initialize RAG database"""
@@ -74,21 +77,30 @@ def main():
         print("Clearing existing collection...")
         vector_store.clear_collection()
     
-    # Process documents
-    print("Processing documents...")
+    # Process documents and add them to the vector store in fixed-size batches,
+    # so embeddings are computed progressively and memory stays bounded
+    print("Processing documents and adding them to vector store...")
     processor = DocumentProcessor(data_path=str(data_path))
-    documents = processor.process_all_documents()
+    batch = []
+    indexed = 0
+    
+    for chunk in processor.iter_documents():
+        batch.append(chunk)
+        if len(batch) == INDEX_BATCH_SIZE:
+            vector_store.add_documents(batch)
+            indexed += len(batch)
+            print(f"Indexed {indexed} chunks so far")
+            batch = []
+    
+    if batch:
+        vector_store.add_documents(batch)
+        indexed += len(batch)
     
-    if not documents:
+    if not indexed:
         print("No documents found to process.")
         return
     
-    print(f"Processed {len(documents)} document chunks")
-    print()
-    
-    # Add to vector store
-    print("Adding documents to vector store...")
-    vector_store.add_documents(documents)
+    print(f"Processed {indexed} document chunks")
     
     # Verify
     final_count = vector_store.get_collection_count()
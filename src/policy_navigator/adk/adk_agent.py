@@ -3,19 +3,53 @@ ADK (Agent Development Kit) Integration for A2A Communication
 Enables interoperability between CrewAI and ADK agents
 """
 
+import json
+import logging
 import os
+import sys
+import threading
+from collections import Counter, defaultdict, deque
+from dataclasses import asdict, dataclass
+from datetime import datetime
+from functools import lru_cache
+from types import MappingProxyType
 from typing import Dict, Any, Optional, List
-from pydantic import BaseModel
+import numpy as np
+
+logger = logging.getLogger(__name__)
 
 try:
     import google.generativeai as genai
     ADK_AVAILABLE = True
 except ImportError:
     ADK_AVAILABLE = False
-    print("Warning: Google Generative AI not available. ADK features will be limited.")
+    logger.warning("Google Generative AI not available. ADK features will be limited.")
+
+try:
+    import orjson
+except ImportError:
+    # Optional: A2AMessage falls back to the stdlib json module
+    orjson = None
+
+# ADK settings read from the environment once; entry points load .env
+# before importing this module, and refresh_env() re-reads them if needed
+_ADK_MODEL_DEFAULT = "gemini-pro"
+_GOOGLE_API_KEY: Optional[str] = None
 
 
-class A2AMessage(BaseModel):
+def refresh_env() -> None:
+    """Re-read the ADK model and API key settings from the environment"""
+    global _ADK_MODEL_DEFAULT, _GOOGLE_API_KEY
+    _ADK_MODEL_DEFAULT = os.getenv("ADK_MODEL", "gemini-pro")
+    # Try GOOGLE_API_KEY first (from .env), fallback to GEMINI_API_KEY
+    _GOOGLE_API_KEY = os.getenv("GOOGLE_API_KEY") or os.getenv("GEMINI_API_KEY")
+
+
+refresh_env()
+
+
+@dataclass(slots=True)
+class A2AMessage:
     """
     Message format for A2A (Agent-to-Agent) communication
     Aligned with A2A Protocol standards for interoperability between CrewAI and ADK agents
@@ -25,89 +59,221 @@ class A2AMessage(BaseModel):
     - Context sharing across agent boundaries
     - Status updates and capability discovery
     - Conversation tracking for multi-turn interactions
+    
+    A slotted dataclass rather than a Pydantic model: messages are created on
+    every agent hop and are only ever built from trusted in-process values,
+    so per-construction validation and a per-instance __dict__ are not needed.
     """
+    # Source agent identifier (e.g., 'calculator_agent', 'policy_researcher')
     from_agent: str
-    """Source agent identifier (e.g., 'calculator_agent', 'policy_researcher')"""
+    # Target agent identifier or broadcast target (e.g., 'crewai_agents', 'adk_agents')
     to_agent: str
-    """Target agent identifier or broadcast target (e.g., 'crewai_agents', 'adk_agents')"""
+    # Type of message: 'task_delegation', 'task_complete', 'data', 'status_update', 'capability_query'
     message_type: str
-    """Type of message: 'task_delegation', 'task_complete', 'data', 'status_update', 'capability_query'"""
+    # Message payload containing task data, results, or context
     content: Dict[str, Any]
-    """Message payload containing task data, results, or context"""
+    # ISO format timestamp of message creation
     timestamp: str
-    """ISO format timestamp of message creation"""
+    # Optional conversation ID for tracking multi-turn interactions
     conversation_id: Optional[str] = None
-    """Optional conversation ID for tracking multi-turn interactions"""
+    # Message status: 'pending', 'processing', 'completed', 'failed'
     status: Optional[str] = None
-    """Message status: 'pending', 'processing', 'completed', 'failed'"""
+    # List of agent capabilities (for capability discovery)
     capabilities: Optional[List[str]] = None
-    """List of agent capabilities (for capability discovery)"""
+    # Whether this message requires a response from the recipient
     response_required: bool = False
-    """Whether this message requires a response from the recipient"""
+    
+    def __post_init__(self) -> None:
+        # Agent IDs, message types and statuses come from a small fixed set;
+        # interning keeps one copy of each and speeds up the index lookups
+        self.from_agent = sys.intern(self.from_agent)
+        self.to_agent = sys.intern(self.to_agent)
+        self.message_type = sys.intern(self.message_type)
+        if self.status is not None:
+            self.status = sys.intern(self.status)
+    
+    def to_dict(self) -> Dict[str, Any]:
+        """Convert the message to a plain dictionary (for serialization)"""
+        return asdict(self)
+    
+    def to_bytes(self) -> bytes:
+        """Serialize the message to UTF-8 JSON (for crossing process boundaries)"""
+        if orjson is not None:
+            # orjson serializes dataclasses natively, without an asdict() copy
+            return orjson.dumps(self)
+        return json.dumps(self.to_dict(), ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+    
+    @classmethod
+    def from_bytes(cls, data: bytes) -> "A2AMessage":
+        """Deserialize a message produced by to_bytes"""
+        loads = orjson.loads if orjson is not None else json.loads
+        return cls(**loads(data))
+
+
+# Number of independently locked shards the shared state is split across
+STATE_STRIPES = 16
+
+# Default bound on the A2A message queue (see A2A_QUEUE_MAX)
+_A2A_QUEUE_MAX_DEFAULT = 10000
+
+
+def _queue_maxlen() -> Optional[int]:
+    """
+    Read the A2A message queue bound from A2A_QUEUE_MAX
+    
+    Returns:
+        The bound, or None (unbounded) for values below 1; non-integer
+        values fall back to the default
+    """
+    raw = os.getenv("A2A_QUEUE_MAX", str(_A2A_QUEUE_MAX_DEFAULT))
+    try:
+        maxlen = int(raw)
+    except ValueError:
+        logger.warning("Invalid A2A_QUEUE_MAX %r, using default %d", raw, _A2A_QUEUE_MAX_DEFAULT)
+        return _A2A_QUEUE_MAX_DEFAULT
+    return maxlen if maxlen >= 1 else None
 
 
 class StateManager:
     """Manages shared state between CrewAI and ADK agents"""
     
     def __init__(self):
-        import logging
-        self.logger = logging.getLogger(__name__)
-        self.state: Dict[str, Any] = {}
-        self.message_queue: list[A2AMessage] = []
-        self.logger.debug("StateManager initialized")
+        # Shared state is striped by key hash so writers to different keys
+        # rarely contend for the same lock
+        self._stripes: List[Dict[str, Any]] = [{} for _ in range(STATE_STRIPES)]
+        self._stripe_locks = [threading.Lock() for _ in range(STATE_STRIPES)]
+        # Bounded so long-running sessions cannot grow the queue without limit;
+        # the oldest messages are dropped once A2A_QUEUE_MAX is reached
+        self.message_queue: deque[A2AMessage] = deque(maxlen=_queue_maxlen())
+        # Guards message_queue and its indexes, which are updated together
+        self._queue_lock = threading.Lock()
+        # Secondary indexes kept in step with message_queue so lookups by
+        # recipient and summaries by type never scan the whole queue
+        self._by_recipient: Dict[str, deque[A2AMessage]] = defaultdict(deque)
+        self._by_type: Counter = Counter()
+        # A2A messages are only worth building when something reads them;
+        # set A2A_MESSAGES=0 for single-agent runs and tests
+        self._subscribers_enabled = os.getenv("A2A_MESSAGES", "1").lower() not in ("0", "false", "no")
+        logger.debug("StateManager initialized")
+    
+    @property
+    def subscribers_enabled(self) -> bool:
+        """Whether producers should build and queue A2A messages"""
+        return self._subscribers_enabled
+    
+    @subscribers_enabled.setter
+    def subscribers_enabled(self, enabled: bool) -> None:
+        self._subscribers_enabled = enabled
     
     def update_state(self, key: str, value: Any) -> None:
         """Update shared state"""
-        self.state[key] = value
-        self.logger.debug(f"StateManager: Updated state key '{key}' (value type: {type(value).__name__})")
+        i = hash(key) % STATE_STRIPES
+        with self._stripe_locks[i]:
+            self._stripes[i][key] = value
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("StateManager: Updated state key '%s' (value type: %s)", key, type(value).__name__)
     
     def get_state(self, key: str, default: Any = None) -> Any:
         """Get value from shared state"""
-        value = self.state.get(key, default)
-        if value is not None:
-            self.logger.debug(f"StateManager: Retrieved state key '{key}' (value type: {type(value).__name__})")
-        else:
-            self.logger.debug(f"StateManager: State key '{key}' not found, returning default")
+        # A single dict.get is atomic under the GIL, so reads take no lock
+        value = self._stripes[hash(key) % STATE_STRIPES].get(key, default)
+        if logger.isEnabledFor(logging.DEBUG):
+            if value is not None:
+                logger.debug("StateManager: Retrieved state key '%s' (value type: %s)", key, type(value).__name__)
+            else:
+                logger.debug("StateManager: State key '%s' not found, returning default", key)
         return value
     
+    def _append_message(self, message: A2AMessage) -> None:
+        """Append a message to the queue and indexes, evicting the oldest if full (hold _queue_lock)"""
+        if len(self.message_queue) == self.message_queue.maxlen:
+            # The evicted message is also the oldest one for its recipient
+            evicted = self.message_queue[0]
+            recipient_messages = self._by_recipient[evicted.to_agent]
+            recipient_messages.popleft()
+            if not recipient_messages:
+                del self._by_recipient[evicted.to_agent]
+            self._by_type[evicted.message_type] -= 1
+            if not self._by_type[evicted.message_type]:
+                del self._by_type[evicted.message_type]
+        self.message_queue.append(message)
+        self._by_recipient[message.to_agent].append(message)
+        self._by_type[message.message_type] += 1
+    
     def add_message(self, message: A2AMessage) -> None:
         """Add message to A2A queue"""
-        self.message_queue.append(message)
-        self.logger.info(f"StateManager: Added A2A message from '{message.from_agent}' to '{message.to_agent}' (type: {message.message_type})")
-        self.logger.debug(f"StateManager: Total messages in queue: {len(self.message_queue)}")
+        with self._queue_lock:
+            self._append_message(message)
+        logger.info("StateManager: Added A2A message from '%s' to '%s' (type: %s)", message.from_agent, message.to_agent, message.message_type)
+        logger.debug("StateManager: Total messages in queue: %d", len(self.message_queue))
+    
+    def extend_messages(self, messages: List[A2AMessage]) -> None:
+        """Add a batch of messages to A2A queue under one lock acquisition, with a single log entry"""
+        with self._queue_lock:
+            for message in messages:
+                self._append_message(message)
+        logger.info("StateManager: Added batch of %d A2A message(s)", len(messages))
+        logger.debug("StateManager: Total messages in queue: %d", len(self.message_queue))
     
     def get_messages_for_agent(self, agent_id: str) -> list[A2AMessage]:
         """Get messages intended for a specific agent"""
-        messages = [msg for msg in self.message_queue if msg.to_agent == agent_id]
-        self.logger.debug(f"StateManager: Retrieved {len(messages)} message(s) for agent '{agent_id}'")
+        with self._queue_lock:
+            messages = list(self._by_recipient.get(agent_id, ()))
+        logger.debug("StateManager: Retrieved %d message(s) for agent '%s'", len(messages), agent_id)
         return messages
     
-    def get_all_messages(self) -> list[A2AMessage]:
-        """Get all messages in queue (for debugging)"""
-        return list(self.message_queue)
+    def get_all_messages(self) -> tuple[A2AMessage, ...]:
+        """Get a read-only snapshot of all messages in queue (for debugging)"""
+        with self._queue_lock:
+            return tuple(self.message_queue)
     
     def get_state_summary(self) -> Dict[str, Any]:
         """Get summary of state and messages (for debugging)"""
+        with self._queue_lock:
+            total_messages = len(self.message_queue)
+            messages_by_type = dict(self._by_type)
         return {
-            "state_keys": list(self.state.keys()),
-            "total_messages": len(self.message_queue),
-            "messages_by_type": {
-                msg.message_type: sum(1 for m in self.message_queue if m.message_type == msg.message_type)
-                for msg in self.message_queue
-            }
+            "state_keys": [key for stripe in self._stripes for key in list(stripe)],
+            "total_messages": total_messages,
+            "messages_by_type": messages_by_type
         }
 
 
 # Singleton instance
-_state_manager = None
+_state_manager: Optional[StateManager] = None
+_state_manager_lock = threading.Lock()
 
 
 def get_state_manager() -> StateManager:
     """Get singleton StateManager instance"""
     global _state_manager
-    if _state_manager is None:
-        _state_manager = StateManager()
-    return _state_manager
+    # Fast path: no locking once the instance exists
+    state_manager = _state_manager
+    if state_manager is not None:
+        return state_manager
+    # Double-checked so concurrent first callers cannot create two instances
+    with _state_manager_lock:
+        if _state_manager is None:
+            _state_manager = StateManager()
+        return _state_manager
+
+
+@lru_cache(maxsize=8)
+def _get_model(api_key: str, model_name: str) -> "genai.GenerativeModel":
+    """
+    Configure the SDK and create a GenerativeModel, once per (api_key, model_name)
+    
+    Agents sharing a key and model (e.g. an ADKAgent and a CalculatorAgent)
+    reuse the same model object instead of repeating the SDK setup.
+    """
+    genai.configure(api_key=api_key)
+    return genai.GenerativeModel(model_name)
+
+
+@lru_cache(maxsize=1)
+def _warn_missing_api_key() -> None:
+    """Log the missing-API-key warning once per process rather than per agent"""
+    logger.warning("GOOGLE_API_KEY or GEMINI_API_KEY not found. ADK agent will have limited functionality.")
 
 
 class ADKAgent:
@@ -126,18 +292,16 @@ class ADKAgent:
         """
         self.agent_id = agent_id
         # Use ADK_MODEL from .env if available, otherwise use provided model_name or default
-        self.model_name = model_name or os.getenv("ADK_MODEL", "gemini-pro")
+        self.model_name = model_name or _ADK_MODEL_DEFAULT
         self.state_manager = get_state_manager()
         
         if ADK_AVAILABLE:
-            # Try GOOGLE_API_KEY first (from .env), fallback to GEMINI_API_KEY
-            api_key = os.getenv("GOOGLE_API_KEY") or os.getenv("GEMINI_API_KEY")
+            api_key = _GOOGLE_API_KEY
             if api_key:
-                genai.configure(api_key=api_key)
-                self.model = genai.GenerativeModel(self.model_name)
+                self.model = _get_model(api_key, self.model_name)
             else:
                 self.model = None
-                print("Warning: GOOGLE_API_KEY or GEMINI_API_KEY not found. ADK agent will have limited functionality.")
+                _warn_missing_api_key()
         else:
             self.model = None
     
@@ -151,17 +315,21 @@ class ADKAgent:
         Returns:
             Response dictionary
         """
+        # Read the fields used below once up front
+        from_agent = message.from_agent
+        message_type = message.message_type
+        state_manager = self.state_manager
+        
         # Store message in state
-        self.state_manager.add_message(message)
+        state_manager.add_message(message)
         
         # Update shared state with message content
-        state_key = f"{message.from_agent}_output"
-        self.state_manager.update_state(state_key, message.content)
+        state_manager.update_state(from_agent + "_output", message.content)
         
         return {
             "status": "processed",
             "agent_id": self.agent_id,
-            "message_type": message.message_type
+            "message_type": message_type
         }
     
     def send_message_to_crewai(self, to_agent: str, content: Dict[str, Any], message_type: str = "data") -> None:
@@ -173,8 +341,6 @@ class ADKAgent:
             content: Message content
             message_type: Type of message
         """
-        from datetime import datetime
-        
         message = A2AMessage(
             from_agent=self.agent_id,
             to_agent=to_agent,
@@ -185,6 +351,30 @@ class ADKAgent:
         
         self.state_manager.add_message(message)
     
+    def send_messages_batch(self, messages: List[Dict[str, Any]]) -> None:
+        """
+        Send several messages to CrewAI agents in one batch
+        
+        All messages share a single timestamp and are enqueued together.
+        
+        Args:
+            messages: List of dicts with "to_agent", "content" and optional
+                      "message_type" (defaults to "data") keys
+        """
+        timestamp = datetime.now().isoformat()
+        batch = [
+            A2AMessage(
+                from_agent=self.agent_id,
+                to_agent=msg["to_agent"],
+                message_type=msg.get("message_type", "data"),
+                content=msg["content"],
+                timestamp=timestamp
+            )
+            for msg in messages
+        ]
+        
+        self.state_manager.extend_messages(batch)
+    
     def get_crewai_output(self, agent_id: str) -> Optional[Dict[str, Any]]:
         """
         Get output from a CrewAI agent
@@ -236,6 +426,30 @@ def create_adk_agent(agent_id: str = "adk_agent") -> ADKAgent:
     return ADKAgent(agent_id=agent_id)
 
 
+# Lookup tables for CalculatorAgent, keyed by lowercase crop / scheme name
+# Base costs per hectare (in INR)
+_BASE_COSTS = MappingProxyType({
+    "paddy": 45000, "rice": 45000, "maize": 35000, "cotton": 55000,
+    "groundnut": 40000, "redgram": 30000, "tur": 30000, "arhar": 30000
+})
+
+# Average yields per hectare (in kg)
+_YIELDS = MappingProxyType({
+    "paddy": 5500, "rice": 5500, "maize": 3500, "cotton": 500,
+    "groundnut": 2000, "redgram": 1200, "tur": 1200, "arhar": 1200
+})
+
+# Cost inputs below this count are summed in plain Python, where NumPy's
+# array setup would cost more than it saves
+_VECTORIZE_MIN_INPUTS = 8
+
+# Subsidy rates per hectare (in INR)
+_SUBSIDIES = MappingProxyType({
+    "pm_kisan": 6000, "pm-kisan": 6000, "pmfby": 2000,
+    "seed_subsidy": 5000, "fertilizer_subsidy": 3000
+})
+
+
 class CalculatorAgent(ADKAgent):
     """
     ADK Agent specialized for agricultural calculations
@@ -264,19 +478,20 @@ class CalculatorAgent(ADKAgent):
         Returns:
             Dictionary with cost calculation results
         """
-        # Base costs per hectare (in INR)
-        base_costs = {
-            "paddy": 45000, "rice": 45000, "maize": 35000, "cotton": 55000,
-            "groundnut": 40000, "redgram": 30000, "tur": 30000, "arhar": 30000
-        }
-        
-        base_cost = base_costs.get(crop.lower(), 40000)
+        base_cost = _BASE_COSTS.get(crop.lower(), 40000)
         total_cost = base_cost * area
         
         if inputs:
-            for value in inputs.values():
-                if isinstance(value, (int, float)):
-                    total_cost += value * area
+            if len(inputs) < _VECTORIZE_MIN_INPUTS:
+                for value in inputs.values():
+                    if isinstance(value, (int, float)):
+                        total_cost += value * area
+            else:
+                # Sum the per-hectare inputs in one NumPy call, then scale once;
+                # np.array keeps int inputs as ints so the result type is unchanged
+                numeric = np.array([value for value in inputs.values() if isinstance(value, (int, float))])
+                if numeric.size:
+                    total_cost += numeric.sum().item() * area
         
         return {
             "operation": "cost_estimation",
@@ -299,13 +514,7 @@ class CalculatorAgent(ADKAgent):
         Returns:
             Dictionary with yield calculation results
         """
-        # Average yields per hectare (in kg)
-        yields = {
-            "paddy": 5500, "rice": 5500, "maize": 3500, "cotton": 500,
-            "groundnut": 2000, "redgram": 1200, "tur": 1200, "arhar": 1200
-        }
-        
-        avg_yield = yields.get(crop.lower(), 3000)
+        avg_yield = _YIELDS.get(crop.lower(), 3000)
         total_yield = avg_yield * area
         
         return {
@@ -329,13 +538,7 @@ class CalculatorAgent(ADKAgent):
         Returns:
             Dictionary with subsidy calculation results
         """
-        # Subsidy rates per hectare (in INR)
-        subsidies = {
-            "pm_kisan": 6000, "pm-kisan": 6000, "pmfby": 2000,
-            "seed_subsidy": 5000, "fertilizer_subsidy": 3000
-        }
-        
-        subsidy_rate = subsidies.get(scheme.lower(), 0)
+        subsidy_rate = _SUBSIDIES.get(scheme.lower(), 0)
         total_subsidy = subsidy_rate * area
         
         return {
@@ -369,6 +572,100 @@ class CalculatorAgent(ADKAgent):
             "profit_margin_percent": profit_margin
         }
     
+    # Output templates, filled from the calculate_* result dicts
+    _COST_TEMPLATE = (
+        "**Cost of Cultivation Calculation**\n\n"
+        "Crop: {crop}\n"
+        "Area: {area} hectares\n"
+        "Base Cost per hectare: ₹{base_cost_per_hectare:,}\n"
+    )
+    _COST_TOTAL_TEMPLATE = "\n**Total Cost of Cultivation: ₹{total_cost:,}**\n"
+    _YIELD_TEMPLATE = (
+        "**Yield Calculation**\n\n"
+        "Crop: {crop}\n"
+        "Area: {area} hectares\n"
+        "Average Yield per hectare: {yield_per_hectare} kg\n"
+        "\n**Total Expected Yield: {total_yield:,} kg**\n"
+    )
+    _YIELD_VARIETY_TEMPLATE = (
+        "**Yield Calculation**\n\n"
+        "Crop: {crop}\n"
+        "Variety: {variety}\n"
+        "Area: {area} hectares\n"
+        "Average Yield per hectare: {yield_per_hectare} kg\n"
+        "\n**Total Expected Yield: {total_yield:,} kg**\n"
+    )
+    _SUBSIDY_TEMPLATE = (
+        "**Subsidy Calculation**\n\n"
+        "Scheme: {scheme}\n"
+        "Crop: {crop}\n"
+        "Area: {area} hectares\n"
+        "Subsidy Rate per hectare: ₹{subsidy_rate_per_hectare:,}\n"
+        "\n**Total Subsidy Amount: ₹{total_subsidy:,}**\n"
+    )
+    _PROFIT_TEMPLATE = (
+        "**Profit Calculation**\n\n"
+        "Total Revenue: ₹{revenue:,}\n"
+        "Total Cost: ₹{cost:,}\n"
+        "\n**Net Profit: ₹{profit:,}**\n"
+        "Profit Margin: {profit_margin_percent:.2f}%\n"
+    )
+    _LOSS_NOTE_TEMPLATE = "\n⚠️ Note: This indicates a loss of ₹{loss:,}\n"
+    
+    def _format_cost(self, values: Dict[str, Any]) -> str:
+        """Run a cost_estimation calculation and format the result"""
+        result = self.calculate_cost(
+            area=values.get("area", 0),
+            crop=values.get("crop", ""),
+            inputs=values.get("inputs")
+        )
+        if not result['additional_inputs']:
+            return self._COST_TEMPLATE.format_map(result) + self._COST_TOTAL_TEMPLATE.format_map(result)
+        parts = [self._COST_TEMPLATE.format_map(result), "\nAdditional Inputs:\n"]
+        parts.extend(f"  - {key}: ₹{value:,}\n" for key, value in result['additional_inputs'].items())
+        parts.append(self._COST_TOTAL_TEMPLATE.format_map(result))
+        return "".join(parts)
+    
+    def _format_yield(self, values: Dict[str, Any]) -> str:
+        """Run a yield_calculation calculation and format the result"""
+        result = self.calculate_yield(
+            area=values.get("area", 0),
+            crop=values.get("crop", ""),
+            variety=values.get("variety")
+        )
+        template = self._YIELD_VARIETY_TEMPLATE if result['variety'] else self._YIELD_TEMPLATE
+        return template.format_map(result)
+    
+    def _format_subsidy(self, values: Dict[str, Any]) -> str:
+        """Run a subsidy_calculation calculation and format the result"""
+        result = self.calculate_subsidy(
+            scheme=values.get("scheme", ""),
+            area=values.get("area", 0),
+            crop=values.get("crop", "")
+        )
+        if result['subsidy_rate_per_hectare'] == 0:
+            return f"Error: Unknown scheme '{values.get('scheme', '')}'. Available schemes: PM-KISAN, PMFBY, seed_subsidy, fertilizer_subsidy"
+        return self._SUBSIDY_TEMPLATE.format_map(result)
+    
+    def _format_profit(self, values: Dict[str, Any]) -> str:
+        """Run a profit_calculation calculation and format the result"""
+        result = self.calculate_profit(
+            revenue=values.get("revenue", 0),
+            cost=values.get("cost", 0)
+        )
+        output = self._PROFIT_TEMPLATE.format_map(result)
+        if result['profit'] < 0:
+            output += self._LOSS_NOTE_TEMPLATE.format(loss=abs(result['profit']))
+        return output
+    
+    # Operation name -> formatter, so dispatch is a single dict lookup
+    _HANDLERS = {
+        "cost_estimation": _format_cost,
+        "yield_calculation": _format_yield,
+        "subsidy_calculation": _format_subsidy,
+        "profit_calculation": _format_profit,
+    }
+    
     def perform_calculation(self, operation: str, values: Dict[str, Any]) -> str:
         """
         Perform agricultural calculation and format result
@@ -380,69 +677,10 @@ class CalculatorAgent(ADKAgent):
         Returns:
             Formatted calculation result string
         """
-        if operation == "cost_estimation":
-            result = self.calculate_cost(
-                area=values.get("area", 0),
-                crop=values.get("crop", ""),
-                inputs=values.get("inputs")
-            )
-            output = f"**Cost of Cultivation Calculation**\n\n"
-            output += f"Crop: {result['crop']}\n"
-            output += f"Area: {result['area']} hectares\n"
-            output += f"Base Cost per hectare: ₹{result['base_cost_per_hectare']:,}\n"
-            if result['additional_inputs']:
-                output += f"\nAdditional Inputs:\n"
-                for key, value in result['additional_inputs'].items():
-                    output += f"  - {key}: ₹{value:,}\n"
-            output += f"\n**Total Cost of Cultivation: ₹{result['total_cost']:,}**\n"
-            return output
-            
-        elif operation == "yield_calculation":
-            result = self.calculate_yield(
-                area=values.get("area", 0),
-                crop=values.get("crop", ""),
-                variety=values.get("variety")
-            )
-            output = f"**Yield Calculation**\n\n"
-            output += f"Crop: {result['crop']}\n"
-            if result['variety']:
-                output += f"Variety: {result['variety']}\n"
-            output += f"Area: {result['area']} hectares\n"
-            output += f"Average Yield per hectare: {result['yield_per_hectare']} kg\n"
-            output += f"\n**Total Expected Yield: {result['total_yield']:,} kg**\n"
-            return output
-            
-        elif operation == "subsidy_calculation":
-            result = self.calculate_subsidy(
-                scheme=values.get("scheme", ""),
-                area=values.get("area", 0),
-                crop=values.get("crop", "")
-            )
-            if result['subsidy_rate_per_hectare'] == 0:
-                return f"Error: Unknown scheme '{values.get('scheme', '')}'. Available schemes: PM-KISAN, PMFBY, seed_subsidy, fertilizer_subsidy"
-            output = f"**Subsidy Calculation**\n\n"
-            output += f"Scheme: {result['scheme']}\n"
-            output += f"Crop: {result['crop']}\n"
-            output += f"Area: {result['area']} hectares\n"
-            output += f"Subsidy Rate per hectare: ₹{result['subsidy_rate_per_hectare']:,}\n"
-            output += f"\n**Total Subsidy Amount: ₹{result['total_subsidy']:,}**\n"
-            return output
-            
-        elif operation == "profit_calculation":
-            result = self.calculate_profit(
-                revenue=values.get("revenue", 0),
-                cost=values.get("cost", 0)
-            )
-            output = f"**Profit Calculation**\n\n"
-            output += f"Total Revenue: ₹{result['revenue']:,}\n"
-            output += f"Total Cost: ₹{result['cost']:,}\n"
-            output += f"\n**Net Profit: ₹{result['profit']:,}**\n"
-            output += f"Profit Margin: {result['profit_margin_percent']:.2f}%\n"
-            if result['profit'] < 0:
-                output += f"\n⚠️ Note: This indicates a loss of ₹{abs(result['profit']):,}\n"
-            return output
-        else:
+        handler = self._HANDLERS.get(operation)
+        if handler is None:
             return f"Error: Unknown operation '{operation}'. Valid operations are: cost_estimation, yield_calculation, subsidy_calculation, profit_calculation"
+        return handler(self, values)
 
 
 def create_calculator_agent(agent_id: str = "calculator_agent") -> CalculatorAgent:
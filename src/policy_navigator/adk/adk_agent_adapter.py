@@ -14,24 +14,150 @@ For remote A2A agents, use CrewAI's native A2AConfig with endpoint URLs.
 
 import logging
 import json
-from typing import Dict, Any, Optional, List, Type, ClassVar
+import re
+import uuid
+from functools import lru_cache
+from types import MappingProxyType
+from typing import TYPE_CHECKING, Callable, Dict, Any, FrozenSet, Mapping, Optional, List, Tuple, Type, ClassVar
 from datetime import datetime
 
 from crewai.agents.agent_adapters.base_agent_adapter import BaseAgentAdapter
 from crewai.tools import BaseTool
 from crewai import Task, LLM
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field, PrivateAttr
 
-from policy_navigator.adk.adk_agent import (
-    CalculatorAgent,
-    create_calculator_agent,
-    get_state_manager,
-    A2AMessage
-)
+if TYPE_CHECKING:
+    from policy_navigator.adk.adk_agent import A2AMessage
+
+try:
+    import orjson
+except ImportError:
+    # Optional: fall back to the stdlib json module
+    orjson = None
 
 logger = logging.getLogger(__name__)
 
 
+@lru_cache(maxsize=1)
+def _adk():
+    """Import the ADK agent module on first use (it loads google.generativeai and numpy)"""
+    from policy_navigator.adk import adk_agent
+    return adk_agent
+
+# Identity used when agents.yaml does not provide one
+_DEFAULT_ROLE = "ADK Agent"
+_DEFAULT_GOAL = "Execute tasks using ADK"
+_DEFAULT_BACKSTORY = "An ADK agent integrated with CrewAI"
+
+
+def _json_loads(data: Any) -> Any:
+    """Parse JSON with orjson when available (both raise json.JSONDecodeError)"""
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def _json_dumps(obj: Any, indent: bool = False) -> str:
+    """Serialize to a JSON string with orjson when available"""
+    if orjson is not None:
+        option = orjson.OPT_NON_STR_KEYS | (orjson.OPT_INDENT_2 if indent else 0)
+        return orjson.dumps(obj, option=option).decode()
+    return json.dumps(obj, indent=2 if indent else None)
+
+# Parsing helpers for calculation tasks described in free text
+_AREA_RE = re.compile(r'area[:\s]+([0-9.]+)', re.IGNORECASE)
+_CROP_RE = re.compile(r'crop[:\s]+([a-zA-Z]+)', re.IGNORECASE)
+# Keyword -> operation in priority order: the first keyword present in the
+# description wins (each "<op>_calculation" name contains its keyword)
+_OPERATION_KEYWORDS = (
+    ("cost", "cost_estimation"),
+    ("yield", "yield_calculation"),
+    ("subsidy", "subsidy_calculation"),
+    ("profit", "profit_calculation"),
+)
+# All keywords in one alternation so the description is scanned once
+_OPERATION_RE = re.compile("|".join(re.escape(keyword) for keyword, _ in _OPERATION_KEYWORDS), re.IGNORECASE)
+
+
+def _is_str_list(value: Any) -> bool:
+    """Check for a plain list of plain strings"""
+    return type(value) is list and all(type(item) is str for item in value)
+
+
+def _is_str_dict(value: Any) -> bool:
+    """Check for a plain dict mapping plain strings to plain strings"""
+    return type(value) is dict and all(type(k) is str and type(v) is str for k, v in value.items())
+
+
+# Field annotations model_construct may fill from unvalidated data, with the
+# exact-type check each value must pass (validation would coerce or reject
+# anything else, e.g. 1 for a float field or a dict for a nested model)
+_CONSTRUCT_TYPE_CHECKS: Mapping[Any, Callable[[Any], bool]] = MappingProxyType({
+    str: lambda value: type(value) is str,
+    int: lambda value: type(value) is int,
+    float: lambda value: type(value) is float,
+    bool: lambda value: type(value) is bool,
+    List[str]: _is_str_list,
+    list[str]: _is_str_list,
+    Dict[str, str]: _is_str_dict,
+    dict[str, str]: _is_str_dict,
+})
+
+
+@lru_cache(maxsize=64)
+def _construct_requirements(pydantic_model: Type[BaseModel]) -> Optional[Tuple[FrozenSet[str], Mapping[str, Callable[[Any], bool]]]]:
+    """
+    Get what data must satisfy to build a model with model_construct
+    
+    Returns:
+        (required field keys, type check per field key), or None if the model
+        defines field or model validators or has a field whose type is not a
+        plain scalar, List[str] or Dict[str, str] (nested models, Optional,
+        Any, ...), since model_construct would skip that validation
+    """
+    decorators = pydantic_model.__pydantic_decorators__
+    if decorators.field_validators or decorators.model_validators:
+        return None
+    required = []
+    checks = {}
+    for name, field in pydantic_model.model_fields.items():
+        check = _CONSTRUCT_TYPE_CHECKS.get(field.annotation)
+        if check is None or field.metadata:
+            # Unsupported type, or constraints such as min_length / ge
+            return None
+        key = field.alias or name
+        checks[key] = check
+        if field.is_required():
+            required.append(key)
+    return frozenset(required), MappingProxyType(checks)
+
+
+@lru_cache(maxsize=64)
+def _model_core(pydantic_model: Type[BaseModel]) -> Tuple[Any, Any]:
+    """
+    Get the (validator, serializer) pair for an output model
+    
+    Resolved once per model class, so repeated tasks with the same
+    output_pydantic call pydantic-core directly instead of going through
+    the model_validate / model_dump_json wrappers.
+    """
+    return pydantic_model.__pydantic_validator__, pydantic_model.__pydantic_serializer__
+
+
+def _can_construct_without_validation(pydantic_model: Type[BaseModel], data: Any) -> bool:
+    """Check whether trusted data can be turned into the model without validation"""
+    if not isinstance(data, dict):
+        return False
+    requirements = _construct_requirements(pydantic_model)
+    if requirements is None:
+        return False
+    required, checks = requirements
+    if not required.issubset(data):
+        return False
+    # Keys that are not fields are ignored by model_construct, as by validation
+    return all(check(data[key]) for key, check in checks.items() if key in data)
+
+
 class ADKAgentAdapter(BaseAgentAdapter):
     """
     Adapter to make ADK agents compatible with CrewAI using A2A Protocol concepts
@@ -60,12 +186,19 @@ class ADKAgentAdapter(BaseAgentAdapter):
         ],
     }
     
+    # Neither attribute assignments nor existing instances are re-validated;
+    # adapters are created per agent and hold arbitrary framework objects
+    model_config = ConfigDict(
+        arbitrary_types_allowed=True,
+        extra='ignore',
+        revalidate_instances='never',
+        validate_assignment=False
+    )
+    
     # Instance fields (Pydantic fields with defaults)
     adk_agent: Optional[Any] = Field(default=None, exclude=True)
     agent_id: str = Field(default="")
-    state_manager: Optional[Any] = Field(default=None, exclude=True)
-    capabilities: List[str] = Field(default_factory=list)
-    crewai_tools: List[BaseTool] = Field(default_factory=list, exclude=True)
+    capabilities: Tuple[str, ...] = Field(default_factory=tuple)
     output_pydantic: Optional[Type[BaseModel]] = Field(default=None, exclude=True)
     output_json: bool = Field(default=False, exclude=True)
     function_calling_llm: Optional[LLM] = Field(default=None, exclude=True)
@@ -78,6 +211,10 @@ class ADKAgentAdapter(BaseAgentAdapter):
     max_execution_time: Optional[int] = Field(default=None, exclude=True)
     callbacks: List[Any] = Field(default_factory=list, exclude=True)
     
+    # Internal state that is never part of the model schema
+    _state_manager: Optional[Any] = PrivateAttr(default=None)
+    _crewai_tools: List[BaseTool] = PrivateAttr(default_factory=list)
+    
     def __init__(
         self,
         adk_agent: Any,  # CalculatorAgent
@@ -93,14 +230,10 @@ class ADKAgentAdapter(BaseAgentAdapter):
             **kwargs: Additional arguments passed to BaseAgentAdapter
         """
         # Extract role, goal, backstory from config (required by BaseAgent)
-        if agent_config:
-            role = agent_config.get("role", "ADK Agent")
-            goal = agent_config.get("goal", "Execute tasks using ADK")
-            backstory = agent_config.get("backstory", "An ADK agent integrated with CrewAI")
-        else:
-            role = "ADK Agent"
-            goal = "Execute tasks using ADK"
-            backstory = "An ADK agent integrated with CrewAI"
+        config = agent_config or {}
+        role = config.get("role", _DEFAULT_ROLE)
+        goal = config.get("goal", _DEFAULT_GOAL)
+        backstory = config.get("backstory", _DEFAULT_BACKSTORY)
         
         # Extract common BaseAgent attributes from kwargs
         function_calling_llm = kwargs.pop('function_calling_llm', None)
@@ -126,32 +259,26 @@ class ADKAgentAdapter(BaseAgentAdapter):
             **kwargs
         )
         
-        # Set attributes that might not be set by parent
-        if not hasattr(self, 'function_calling_llm') or self.function_calling_llm is None:
-            self.function_calling_llm = function_calling_llm
-        if not hasattr(self, 'step_callback') or self.step_callback is None:
-            self.step_callback = step_callback
-        if not hasattr(self, 'task_callback') or self.task_callback is None:
-            self.task_callback = task_callback
-        if not hasattr(self, 'verbose'):
-            self.verbose = verbose
-        if not hasattr(self, 'allow_delegation'):
-            self.allow_delegation = allow_delegation
-        if not hasattr(self, 'max_iter'):
-            self.max_iter = max_iter
-        if not hasattr(self, 'max_execution_time'):
-            self.max_execution_time = max_execution_time
-        if not hasattr(self, 'callbacks'):
-            self.callbacks = callbacks
+        # Set attributes that might not be set by parent. All of them are
+        # declared fields, so only empty values need filling in; verbose,
+        # allow_delegation, max_iter and max_execution_time went to super()
+        for name, value in (
+            ('function_calling_llm', function_calling_llm),
+            ('step_callback', step_callback),
+            ('task_callback', task_callback),
+            ('callbacks', callbacks),
+        ):
+            if not getattr(self, name):
+                setattr(self, name, value)
         
         # Set instance fields after parent initialization
         # These fields are declared with Field() defaults, so we can set them normally
         self.adk_agent = adk_agent
         self.agent_id = adk_agent.agent_id
-        self.state_manager = get_state_manager()
+        self._state_manager = _adk().get_state_manager()
         
         # Get agent capabilities for A2A protocol
-        self.capabilities = self.AGENT_CAPABILITIES.get(adk_agent.agent_id, [])
+        self.capabilities = _CAPS_BY_AGENT.get(adk_agent.agent_id, ())
         
         logger.info(f"Initialized ADKAgentAdapter for agent: {adk_agent.agent_id} with A2A Protocol support")
         logger.debug(f"ADKAgentAdapter ({adk_agent.agent_id}): Capabilities: {self.capabilities}")
@@ -169,9 +296,9 @@ class ADKAgentAdapter(BaseAgentAdapter):
             logger.debug(f"ADKAgentAdapter ({self.agent_id}): Received {len(tools)} tools")
             # ADK agents use their own methods, not CrewAI tools
             # Store tools for reference but don't convert them
-            self.crewai_tools = tools
+            self._crewai_tools = tools
         else:
-            self.crewai_tools = []
+            self._crewai_tools = []
             logger.debug(f"ADKAgentAdapter ({self.agent_id}): No tools provided")
     
     def configure_structured_output(self, task: Task) -> None:
@@ -211,8 +338,19 @@ class ADKAgentAdapter(BaseAgentAdapter):
         """
         logger.info(f"ADKAgentAdapter ({self.agent_id}): Executing delegated task via A2A Protocol: {task.description[:100]}...")
         
+        # One conversation ID links the delegation and completion messages
+        conversation_id = uuid.uuid4().hex
+        
+        # A2A messages are skipped entirely when nothing consumes them
+        send_messages = self._state_manager.subscribers_enabled
+        # Delegation and completion messages are queued together at the end
+        pending_messages: List["A2AMessage"] = []
+        
         # Create A2A message for task delegation (status: processing)
-        self._create_a2a_delegation_message(task, context)
+        if send_messages:
+            pending_messages.append(
+                self._create_a2a_delegation_message(task, context, conversation_id, datetime.now().isoformat())
+            )
         
         # Configure structured output
         self.configure_structured_output(task)
@@ -222,7 +360,7 @@ class ADKAgentAdapter(BaseAgentAdapter):
         if context:
             # Handle both dict and string contexts
             if isinstance(context, dict):
-                task_description += f"\n\nContext from previous tasks:\n{json.dumps(context, indent=2)}"
+                task_description += f"\n\nContext from previous tasks:\n{_json_dumps(context, indent=True)}"
             elif isinstance(context, str):
                 task_description += f"\n\nContext from previous tasks:\n{context}"
         
@@ -231,7 +369,7 @@ class ADKAgentAdapter(BaseAgentAdapter):
         execution_status = "completed"
         
         try:
-            if isinstance(self.adk_agent, CalculatorAgent):
+            if hasattr(self.adk_agent, "perform_calculation"):
                 result = self._execute_calculation_task(task, context)
             else:
                 # Generic ADK agent execution
@@ -242,10 +380,16 @@ class ADKAgentAdapter(BaseAgentAdapter):
             logger.error(f"ADKAgentAdapter ({self.agent_id}): Task execution failed: {e}")
         
         # Store result in StateManager for A2A communication
-        self._store_result_in_state(result)
+        completed_at = datetime.now().isoformat()
+        self._store_result_in_state(result, completed_at)
         
         # Create A2A message with status
-        self._create_a2a_message(result, execution_status)
+        if send_messages:
+            result_summary = str(result)[:500] if result else "No result"
+            pending_messages.append(
+                self._create_a2a_message(result_summary, execution_status, conversation_id, completed_at)
+            )
+            self._state_manager.extend_messages(pending_messages)
         
         # Convert to structured output if needed
         if self.output_pydantic:
@@ -255,15 +399,19 @@ class ADKAgentAdapter(BaseAgentAdapter):
         
         return result
     
-    def _create_a2a_delegation_message(self, task: Task, context: Optional[Dict[str, Any]] = None) -> None:
+    def _create_a2a_delegation_message(
+        self,
+        task: Task,
+        context: Optional[Dict[str, Any]],
+        conversation_id: str,
+        timestamp: str
+    ) -> "A2AMessage":
         """
         Create A2A message for task delegation (A2A Protocol)
         
         This message indicates that a task has been delegated to this ADK agent
         """
-        import uuid
-        
-        a2a_message = A2AMessage(
+        a2a_message = _adk().A2AMessage(
             from_agent="crewai_workflow",
             to_agent=self.agent_id,
             message_type="task_delegation",
@@ -272,15 +420,15 @@ class ADKAgentAdapter(BaseAgentAdapter):
                 "task_id": getattr(task, 'id', 'unknown'),
                 "context_available": context is not None
             },
-            timestamp=datetime.now().isoformat(),
-            conversation_id=str(uuid.uuid4()),
+            timestamp=timestamp,
+            conversation_id=conversation_id,
             status="processing",
             capabilities=self.capabilities,
             response_required=True
         )
         
-        self.state_manager.add_message(a2a_message)
         logger.debug(f"ADKAgentAdapter ({self.agent_id}): Received A2A task delegation message")
+        return a2a_message
     
     def _execute_calculation_task(self, task: Task, context: Optional[Dict[str, Any]] = None) -> str:
         """Execute calculation task"""
@@ -295,28 +443,20 @@ class ADKAgentAdapter(BaseAgentAdapter):
         
         # If not in context, try to parse from task description
         if not operation:
-            import re
-            # Look for operation type in description
-            if "cost" in task.description.lower() or "cost_estimation" in task.description.lower():
-                operation = "cost_estimation"
-            elif "yield" in task.description.lower() or "yield_calculation" in task.description.lower():
-                operation = "yield_calculation"
-            elif "subsidy" in task.description.lower() or "subsidy_calculation" in task.description.lower():
-                operation = "subsidy_calculation"
-            elif "profit" in task.description.lower() or "profit_calculation" in task.description.lower():
-                operation = "profit_calculation"
+            description = task.description
+            # Look for operation type in description (highest-priority keyword wins)
+            found = {keyword.lower() for keyword in _OPERATION_RE.findall(description)}
+            operation = next((op for keyword, op in _OPERATION_KEYWORDS if keyword in found), None)
             
             # Try to extract values from description
             # This is a simplified extraction - in practice, the task description should be clear
-            if "area" in task.description.lower():
-                area_match = re.search(r'area[:\s]+([0-9.]+)', task.description, re.IGNORECASE)
-                if area_match:
-                    values["area"] = float(area_match.group(1))
+            area_match = _AREA_RE.search(description)
+            if area_match:
+                values["area"] = float(area_match.group(1))
             
-            if "crop" in task.description.lower():
-                crop_match = re.search(r'crop[:\s]+([a-zA-Z]+)', task.description, re.IGNORECASE)
-                if crop_match:
-                    values["crop"] = crop_match.group(1)
+            crop_match = _CROP_RE.search(description)
+            if crop_match:
+                values["crop"] = crop_match.group(1)
         
         if not operation:
             return "Error: Could not determine calculation operation from task description or context"
@@ -326,18 +466,18 @@ class ADKAgentAdapter(BaseAgentAdapter):
         
         return result_str
     
-    def _store_result_in_state(self, result: Any) -> None:
+    def _store_result_in_state(self, result: Any, timestamp: str) -> None:
         """Store task result in StateManager"""
         state_key = f"{self.agent_id}_output"
         result_data = {
             "result": result,
-            "timestamp": datetime.now().isoformat(),
+            "timestamp": timestamp,
             "agent_id": self.agent_id
         }
-        self.state_manager.update_state(state_key, result_data)
+        self._state_manager.update_state(state_key, result_data)
         logger.debug(f"ADKAgentAdapter ({self.agent_id}): Stored result in StateManager")
     
-    def _create_a2a_message(self, result: Any, status: str = "completed") -> None:
+    def _create_a2a_message(self, result_summary: str, status: str, conversation_id: str, timestamp: str) -> "A2AMessage":
         """
         Create A2A message after task completion
         
@@ -346,28 +486,27 @@ class ADKAgentAdapter(BaseAgentAdapter):
         - Includes agent capabilities for discovery
         - Sets status for tracking (completed/failed)
         """
-        import uuid
-        
-        a2a_message = A2AMessage(
+        a2a_message = _adk().A2AMessage(
             from_agent=self.agent_id,
             to_agent="crewai_agents",  # Broadcast to all CrewAI agents (A2A pattern)
             message_type="task_complete",
             content={
                 "agent_id": self.agent_id,
-                "result_summary": str(result)[:500] if result else "No result",
+                "result_summary": result_summary,
                 "capabilities": self.capabilities,
-                "timestamp": datetime.now().isoformat()
+                "timestamp": timestamp
             },
-            timestamp=datetime.now().isoformat(),
-            conversation_id=str(uuid.uuid4()),  # Track this conversation
+            timestamp=timestamp,
+            conversation_id=conversation_id,  # Track this conversation
             status=status,
             capabilities=self.capabilities,
             response_required=False
         )
         
-        self.state_manager.add_message(a2a_message)
         logger.info(f"ADKAgentAdapter ({self.agent_id}): Created A2A message to CrewAI agents (A2A Protocol)")
-        logger.debug(f"ADKAgentAdapter ({self.agent_id}): A2A Message - Type: {a2a_message.message_type}, Status: {a2a_message.status}, Capabilities: {a2a_message.capabilities}")
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug(f"ADKAgentAdapter ({self.agent_id}): A2A Message - Type: {a2a_message.message_type}, Status: {a2a_message.status}, Capabilities: {a2a_message.capabilities}, Summary: {result_summary[:100]}")
+        return a2a_message
     
     def _convert_to_pydantic(self, result: str, pydantic_model: Type[BaseModel]) -> str:
         """Convert result string to Pydantic model format"""
@@ -375,33 +514,38 @@ class ADKAgentAdapter(BaseAgentAdapter):
             # Try to parse as JSON first
             if isinstance(result, str):
                 try:
-                    result_dict = json.loads(result)
+                    result_dict = _json_loads(result)
                 except json.JSONDecodeError:
                     # If not JSON, try to create a dict from the string
                     result_dict = {"raw_output": result}
             else:
                 result_dict = result
             
-            # Create Pydantic model instance
-            # Generic Pydantic model creation
-            model_instance = pydantic_model.model_validate(result_dict)
-            return model_instance.model_dump_json()
+            # Create Pydantic model instance. ADK results are produced in-process,
+            # so validation is skipped when the model has no custom validators
+            # and every required field is present
+            validator, serializer = _model_core(pydantic_model)
+            if _can_construct_without_validation(pydantic_model, result_dict):
+                model_instance = pydantic_model.model_construct(**result_dict)
+            else:
+                model_instance = validator.validate_python(result_dict)
+            return serializer.to_json(model_instance).decode()
         except Exception as e:
             logger.warning(f"ADKAgentAdapter ({self.agent_id}): Failed to convert to Pydantic, returning raw result: {e}")
-            return result if isinstance(result, str) else json.dumps(result)
+            return result if isinstance(result, str) else _json_dumps(result)
     
     def _convert_to_json(self, result: str) -> str:
         """Convert result to JSON format"""
         try:
             if isinstance(result, str):
                 # Try to parse as JSON to validate
-                json.loads(result)
+                _json_loads(result)
                 return result
             else:
-                return json.dumps(result)
+                return _json_dumps(result)
         except json.JSONDecodeError:
             # If not valid JSON, wrap it
-            return json.dumps({"result": result})
+            return _json_dumps({"result": result})
     
     def execute_task(
         self,
@@ -430,7 +574,7 @@ class ADKAgentAdapter(BaseAgentAdapter):
         if context:
             try:
                 # Try to parse as JSON
-                context_dict = json.loads(context)
+                context_dict = _json_loads(context)
             except (json.JSONDecodeError, TypeError):
                 # If not JSON, treat as plain string
                 context_dict = {"context": context}
@@ -466,6 +610,13 @@ class ADKAgentAdapter(BaseAgentAdapter):
         return []
 
 
+# Immutable capability tuples shared by every adapter instance and A2A message
+_CAPS_BY_AGENT: Mapping[str, Tuple[str, ...]] = MappingProxyType({
+    agent_id: tuple(capabilities)
+    for agent_id, capabilities in ADKAgentAdapter.AGENT_CAPABILITIES.items()
+})
+
+
 def create_calculator_adapter(agent_config: Optional[Dict[str, Any]] = None) -> ADKAgentAdapter:
     """
     Factory function to create Calculator ADK Agent Adapter
@@ -476,6 +627,6 @@ def create_calculator_adapter(agent_config: Optional[Dict[str, Any]] = None) ->
     Returns:
         ADKAgentAdapter instance wrapping CalculatorAgent
     """
-    calc_agent = create_calculator_agent()
+    calc_agent = _adk().create_calculator_agent()
     return ADKAgentAdapter(adk_agent=calc_agent, agent_config=agent_config)
 
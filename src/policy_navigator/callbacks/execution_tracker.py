@@ -2,38 +2,34 @@
 Execution Tracker - Tracks agents and tools used during crew execution
 """
 
-from typing import Dict, Set, List, Optional, Any
+import sys
+from contextlib import nullcontext
+from typing import Dict, Set, List, Optional, Any, Iterable
 from threading import Lock
 from collections import defaultdict
 
+# With the GIL, each single dict/set operation used by the track_* methods is
+# atomic, so those hot callback paths can skip the lock. Free-threaded builds
+# (PEP 703) keep it.
+_GIL_ENABLED = getattr(sys, "_is_gil_enabled", lambda: True)()
+
 
 class ExecutionTracker:
     """Thread-safe tracker for agents and tools used during execution"""
     
-    _instance = None
-    _lock = Lock()
-    
-    def __new__(cls):
-        if cls._instance is None:
-            with cls._lock:
-                if cls._instance is None:
-                    cls._instance = super().__new__(cls)
-                    cls._instance._initialized = False
-        return cls._instance
-    
     def __init__(self):
-        if self._initialized:
-            return
-        
-        with self._lock:
-            if self._initialized:
-                return
-            
-            self.executed_agents: List[str] = []  # Changed to list to preserve execution order
-            self.used_tools: Set[str] = set()
-            self.agent_tools: Dict[str, Set[str]] = defaultdict(set)  # agent -> set of tools
-            self.query_analysis: Optional[Any] = None  # Store query_analysis_task output
-            self._initialized = True
+        self._lock = Lock()
+        # Lock taken by the track_* writers; reset() and readers always use _lock
+        self._write_lock = nullcontext() if _GIL_ENABLED else self._lock
+        # Insertion-ordered dict used as an ordered set: keeps execution order
+        # while making the duplicate check a hash lookup
+        self.executed_agents: Dict[str, None] = {}
+        self.used_tools: Set[str] = set()
+        self.agent_tools: Dict[str, Set[str]] = defaultdict(set)  # agent -> set of tools
+        self.query_analysis: Optional[Any] = None  # Store query_analysis_task output
+        # Sorted agent -> tools snapshot, rebuilt only after a write marks it dirty
+        self._agent_tools_snapshot: Dict[str, List[str]] = {}
+        self._agent_tools_dirty = True
     
     def reset(self):
         """Reset tracker for new execution"""
@@ -42,6 +38,7 @@ class ExecutionTracker:
             self.used_tools.clear()
             self.agent_tools.clear()
             self.query_analysis = None
+            self._agent_tools_dirty = True
     
     def store_query_analysis(self, query_analysis: Any):
         """Store query_analysis_task output for conditional task checks"""
@@ -50,52 +47,88 @@ class ExecutionTracker:
     
     def track_agent(self, agent_name: str):
         """Track that an agent executed (preserves execution order)"""
-        with self._lock:
-            # Only add if not already in list (preserve order, avoid duplicates)
-            if agent_name not in self.executed_agents:
-                self.executed_agents.append(agent_name)
-            # Ensure agent has an entry in agent_tools
+        with self._write_lock:
+            # Only added the first time (preserve order, avoid duplicates)
+            self.executed_agents.setdefault(agent_name, None)
+            # Ensure agent has an entry in agent_tools; the snapshot only
+            # needs a rebuild when the entry is new
             if agent_name not in self.agent_tools:
                 self.agent_tools[agent_name] = set()
+                self._agent_tools_dirty = True
     
     def track_tool(self, agent_name: str, tool_name: str):
         """Track that a tool was used by an agent"""
-        with self._lock:
+        with self._write_lock:
             self.used_tools.add(tool_name)
-            self.agent_tools[agent_name].add(tool_name)
+            tools = self.agent_tools.get(agent_name)
+            if tools is None or tool_name not in tools:
+                self.agent_tools[agent_name].add(tool_name)
+                self._agent_tools_dirty = True
+            # Also track the agent if not already tracked (preserve order)
+            self.executed_agents.setdefault(agent_name, None)
+    
+    def track_tools(self, agent_name: str, tool_names: Iterable[str]):
+        """Track several tools used by an agent with one lock round-trip"""
+        tool_names = tuple(tool_names)  # May be a one-shot iterator; read twice below
+        with self._write_lock:
+            self.used_tools.update(tool_names)
+            tools = self.agent_tools.get(agent_name)
+            if tools is None:
+                self.agent_tools[agent_name] = set(tool_names)
+                self._agent_tools_dirty = True
+            else:
+                known = len(tools)
+                tools.update(tool_names)
+                if len(tools) != known:
+                    self._agent_tools_dirty = True
             # Also track the agent if not already tracked (preserve order)
-            if agent_name not in self.executed_agents:
-                self.executed_agents.append(agent_name)
+            self.executed_agents.setdefault(agent_name, None)
+    
+    def _executed_agents_unlocked(self) -> List[str]:
+        return list(self.executed_agents)  # Return in execution order, not sorted
+    
+    def _used_tools_unlocked(self) -> List[str]:
+        return sorted(self.used_tools)
+    
+    def _agent_tools_unlocked(self) -> Dict[str, List[str]]:
+        if self._agent_tools_dirty:
+            # Clear the flag before copying: a lock-free writer landing mid-copy
+            # sets it again, so the next read rebuilds instead of going stale
+            self._agent_tools_dirty = False
+            # Snapshot the items first: writers may add agents without the lock
+            self._agent_tools_snapshot = {
+                agent: sorted(tools)
+                for agent, tools in list(self.agent_tools.items())
+            }
+        return self._agent_tools_snapshot
     
     def get_executed_agents(self) -> List[str]:
         """Get list of executed agents (in execution order)"""
         with self._lock:
-            return list(self.executed_agents)  # Return in execution order, not sorted
+            return self._executed_agents_unlocked()
     
     def get_used_tools(self) -> List[str]:
         """Get list of used tools"""
         with self._lock:
-            return sorted(list(self.used_tools))
+            return self._used_tools_unlocked()
     
     def get_agent_tools(self) -> Dict[str, List[str]]:
-        """Get dictionary of agent -> list of tools used"""
+        """Get dictionary of agent -> list of tools used (shared snapshot; do not mutate)"""
         with self._lock:
-            return {
-                agent: sorted(list(tools)) 
-                for agent, tools in self.agent_tools.items()
-            }
+            return self._agent_tools_unlocked()
     
-    def get_summary(self) -> Dict[str, any]:
-        """Get summary of execution"""
+    def get_summary(self) -> Dict[str, Any]:
+        """Get summary of execution (one consistent snapshot under a single lock)"""
         with self._lock:
             return {
-                "executed_agents": self.get_executed_agents(),
-                "used_tools": self.get_used_tools(),
-                "agent_tools": self.get_agent_tools()
+                "executed_agents": self._executed_agents_unlocked(),
+                "used_tools": self._used_tools_unlocked(),
+                "agent_tools": self._agent_tools_unlocked()
             }
 
 
-# Global tracker instance
+# Global tracker instance, created once at import (use get_tracker() rather
+# than constructing ExecutionTracker directly)
 _tracker = ExecutionTracker()
 
 
@@ -3,20 +3,49 @@ Monitoring callbacks for agent execution
 Following CrewAI callback patterns for step_callback and task_callback
 """
 
+import atexit
 import logging
-from typing import Any, Dict
+import logging.handlers
+import os
+import queue
+import re
+import reprlib
+import time
+import uuid
+import weakref
+from collections import namedtuple
+from functools import lru_cache, singledispatch
+from typing import Any, Callable, Dict, List, Optional, Tuple
 from crewai.tasks.task_output import TaskOutput
-from policy_navigator.adk.adk_agent import get_state_manager, A2AMessage
 from policy_navigator.callbacks.execution_tracker import get_tracker
 from policy_navigator.config.tool_mappings import get_tool_display_name, is_adk_tool
-from policy_navigator.models.schemas import QueryAnalysis
 from datetime import datetime
 
+
+def _configure_logging() -> None:
+    """
+    Set up root logging like logging.basicConfig, but non-blocking
+    
+    Records are put on a queue and written to the stream by a background
+    QueueListener, so callbacks on the crew's critical path never wait on
+    stream writes. Does nothing if the root logger already has handlers.
+    """
+    root = logging.getLogger()
+    if root.handlers:
+        return
+    log_queue: queue.SimpleQueue = queue.SimpleQueue()
+    stream_handler = logging.StreamHandler()
+    stream_handler.setFormatter(logging.Formatter('%(asctime)s - %(name)s - %(levelname)s - %(message)s'))
+    listener = logging.handlers.QueueListener(log_queue, stream_handler, respect_handler_level=True)
+    root.addHandler(logging.handlers.QueueHandler(log_queue))
+    root.setLevel(logging.INFO)
+    listener.start()
+    # Flush queued records on interpreter exit
+    atexit.register(listener.stop)
+
+
 # Set up logging
-logging.basicConfig(
-    level=logging.INFO,
-    format='%(asctime)s - %(name)s - %(levelname)s - %(message)s'
-)
+_configure_logging()
 logger = logging.getLogger(__name__)
 
 # Agent role to agent ID mapping
@@ -45,6 +74,353 @@ TASK_NAME_TO_AGENT_ID = {
     'synthesis_task': 'response_synthesizer',
 }
 
+# (task_key, task key with spaces, agent_id) for matching task descriptions
+_TASK_NAME_VARIANTS = tuple(
+    (task_key, task_key.replace('_', ' '), agent_id)
+    for task_key, agent_id in TASK_NAME_TO_AGENT_ID.items()
+)
+
+# Membership sets used on every callback
+_AGENT_ID_VALUES = frozenset(AGENT_ROLE_TO_ID.values())
+_BAD_AGENT_IDS = frozenset({'Unknown', 'unknown_agent'})
+_MCP_AGENT_IDS = frozenset({'market_analyst', 'non_ap_researcher'})  # agents using Ollama Web Search MCP
+
+# Expected tool display names per agent (as shown in the UI, see tool_mappings),
+# tracked as a fallback when CrewAI does not report tool usage for a task
+_EXPECTED_TOOLS_MAP = {
+    'query_analyzer': ('Region Detector',),
+    'policy_researcher': ('RAG Document Search',),
+    'crop_specialist': ('RAG Document Search',),
+    'pest_advisor': ('RAG Document Search',),
+    'market_analyst': ('Ollama Web Search MCP',),  # MCP tools
+    'non_ap_researcher': ('Ollama Web Search MCP',),
+    'pdf_processor_agent': ('PDF Processor (MCP)',),
+    'calculator_agent': ('Calculator (ADK)',),  # ADK agent
+    'response_synthesizer': (),
+}
+
+# Size-bounded reprs for debug logging: containers and strings are cut off
+# while being rendered instead of rendering everything and slicing
+_SHORT_REPR = reprlib.Repr()
+_SHORT_REPR.maxstring = _SHORT_REPR.maxother = 80
+_DEBUG_REPR = reprlib.Repr()
+_DEBUG_REPR.maxstring = _DEBUG_REPR.maxother = 200
+
+# Keys probed, in priority order, on CrewAI step/agent/task/output objects or
+# their dict equivalents (see _extract_first)
+_STEP_AGENT_KEYS = ('agent', 'agent_role', 'agent_name')
+_STEP_ROLE_KEYS = ('agent_role', 'agent_name', 'role')
+_STEP_TASK_KEYS = ('task', 'task_description', 'task_name')
+_STEP_TASK_DESC_KEYS = ('task_description', 'task_name', 'description')
+_STEP_TOOL_CALL_KEYS = ('tool_calls', 'actions', 'tool_uses', 'tools')
+_AGENT_ROLE_KEYS = ('role', 'agent_role', 'name', 'agent_name')
+_TASK_DESC_KEYS = ('description', 'task_description', 'name', 'task_name')
+_OUTPUT_TOOL_CALL_KEYS = ('tool_calls', 'actions')
+
+
+def _as_iter(value: Any) -> tuple:
+    """Return lists/tuples unchanged, wrap a single value in a tuple, and map None to ()"""
+    if isinstance(value, (list, tuple)):
+        return value
+    return (value,) if value is not None else ()
+
+
+def _first_item(obj: Dict[str, Any], keys: tuple) -> Any:
+    """Return the first truthy dict value among keys, or None"""
+    for key in keys:
+        value = obj.get(key)
+        if value:
+            return value
+    return None
+
+
+def _first_attr(obj: Any, keys: tuple) -> Any:
+    """Return the first truthy attribute value among keys, or None"""
+    for key in keys:
+        value = getattr(obj, key, None)
+        if value:
+            return value
+    return None
+
+
+def _extract_first(obj: Any, keys: tuple) -> Any:
+    """
+    Return the first truthy value for keys, read as dict items or attributes
+    
+    Args:
+        obj: Dict or object to probe
+        keys: Candidate keys/attribute names in priority order
+        
+    Returns:
+        First truthy value found, or None
+    """
+    if isinstance(obj, dict):
+        return _first_item(obj, keys)
+    return _first_attr(obj, keys)
+
+def _coerce_agent_role(agent: Any) -> Optional[str]:
+    """Get the role (or name) of an agent given as a CrewAI object or dict"""
+    if agent is None:
+        return None
+    return _extract_first(agent, _AGENT_ROLE_KEYS)
+
+
+def _coerce_task_desc(task: Any) -> Optional[str]:
+    """Get the first 100 characters of a task's description (or name)"""
+    if task is None:
+        return None
+    task_desc = _extract_first(task, _TASK_DESC_KEYS)
+    return task_desc[:100] if task_desc else None
+
+
+# Everything step_callback reads from a step, extracted in one pass
+_StepCtx = namedtuple('_StepCtx', 'agent agent_role task task_desc tool_calls iteration')
+
+
+def _build_step_context(step: Any, first: Callable[[Any, tuple], Any], iteration: Any) -> _StepCtx:
+    """Build a _StepCtx using first (_first_item or _first_attr) to probe the step"""
+    agent = first(step, _STEP_AGENT_KEYS)
+    agent_role = _coerce_agent_role(agent) if agent else None
+    if not agent_role:
+        # Fall back to role fields on the step itself
+        agent_role = first(step, _STEP_ROLE_KEYS)
+    
+    task = first(step, _STEP_TASK_KEYS)
+    task_desc = _coerce_task_desc(task) if task else None
+    if not task_desc:
+        # Fall back to description fields on the step itself
+        task_desc = first(step, _STEP_TASK_DESC_KEYS)
+        if task_desc:
+            task_desc = str(task_desc)[:100]
+    
+    # CrewAI may pass tools in different formats: tool_calls, actions, or tool_uses,
+    # either on the step or on its output
+    tool_calls = first(step, _STEP_TOOL_CALL_KEYS)
+    if not tool_calls:
+        output = first(step, ('output',))
+        if output:
+            tool_calls = _extract_first(output, _OUTPUT_TOOL_CALL_KEYS)
+    
+    return _StepCtx(agent, agent_role, task, task_desc, tool_calls, iteration)
+
+
+@singledispatch
+def _extract_step_context(step: Any) -> _StepCtx:
+    """Extract step context from a CrewAI step object"""
+    return _build_step_context(step, _first_attr, getattr(step, 'iterations', 0))
+
+
+@_extract_step_context.register(dict)
+def _extract_dict_step_context(step: Dict[str, Any]) -> _StepCtx:
+    """Extract step context from a step passed as a dict"""
+    return _build_step_context(step, _first_item, step.get('iterations', 0))
+
+
+# Description keyword rules checked in order; a rule matches when every group
+# has at least one keyword in the lowercased description
+_KEYWORD_RULES = (
+    ((('query',), ('analysis', 'analyze')), 'query_analyzer'),
+    ((('policy', 'scheme'),), 'policy_researcher'),
+    ((('crop', 'cultivation'),), 'crop_specialist'),
+    ((('pest', 'disease'),), 'pest_advisor'),
+    ((('market', 'msp', 'price'),), 'market_analyst'),
+    ((('non-ap', 'non ap', 'web search'),), 'non_ap_researcher'),
+    ((('synthesize', 'response', 'final'),), 'response_synthesizer'),
+    ((('pdf', 'document'),), 'pdf_processor_agent'),  # PDF processing uses CrewAI agent with PDF MCP tool
+    ((('calculation', 'calculate'),), 'calculator_agent'),  # Calculations use ADK agent
+)
+# Every rule keyword in one case-insensitive alternation; the lookahead reports
+# overlapping matches so one pass finds every keyword present
+_KEYWORD_RE = re.compile(
+    '(?=(' + '|'.join(
+        re.escape(keyword)
+        for keyword in sorted(
+            {keyword for groups, _ in _KEYWORD_RULES for group in groups for keyword in group},
+            key=len,
+            reverse=True
+        )
+    ) + '))',
+    re.IGNORECASE
+)
+
+
+@lru_cache(maxsize=256)
+def _agent_id_from_description(task_desc: str) -> Optional[str]:
+    """Identify agent ID from task description keywords (memoized per description)"""
+    found = {keyword.lower() for keyword in _KEYWORD_RE.findall(task_desc)}
+    if not found:
+        return None
+    for groups, agent_id in _KEYWORD_RULES:
+        if all(not found.isdisjoint(group) for group in groups):
+            return agent_id
+    return None
+
+
+# ADK detection is a pure function over a small set of names, so memoize it
+# per distinct raw name (get_tool_display_name is memoized in tool_mappings)
+_is_adk = lru_cache(maxsize=128)(is_adk_tool)
+
+
+# Function reprs such as '<function web_search at 0x7f...>' used as tool names
+_FUNC_REPR_RE = re.compile(r'\s*<function\s+(\S+?)(?:\s+at\s+0x[0-9a-fA-F]+>?|>?\s*$)')
+
+
+@lru_cache(maxsize=256)
+def _clean_tool_name(tool_name: str) -> str:
+    """Strip function-repr noise such as '<function name at 0x...>' from a tool name"""
+    match = _FUNC_REPR_RE.match(tool_name)
+    if match:
+        return match.group(1)
+    return tool_name.partition(' at ')[0].partition('>')[0].strip()
+
+# Ollama Web Search MCP tool names: web_search/web_fetch variants, or any name
+# mentioning both "ollama" and "search"
+_OLLAMA_TOOL_RE = re.compile(r'web_search|web_fetch|ollama.*search|search.*ollama', re.IGNORECASE | re.DOTALL)
+
+# Looser check used by task_callback: any mention of ollama, web_search or
+# web_fetch in a tracked tool name or in the task output
+_OLLAMA_REF_RE = re.compile(r'ollama|web_search|web_fetch', re.IGNORECASE)
+
+
+def _iter_str_values(obj: Any):
+    """Yield the string keys and values of a nested dict/list structure"""
+    if isinstance(obj, str):
+        yield obj
+    elif isinstance(obj, dict):
+        for key, value in obj.items():
+            if isinstance(key, str):
+                yield key
+            yield from _iter_str_values(value)
+    elif isinstance(obj, (list, tuple)):
+        for item in obj:
+            yield from _iter_str_values(item)
+
+
+def _has_ollama_ref(raw: Any) -> bool:
+    """
+    Check task output for Ollama Web Search MCP references
+    
+    Structured (dict) output is searched string by string, stopping at the
+    first match, instead of being serialized to JSON first.
+    """
+    if isinstance(raw, dict):
+        return any(_OLLAMA_REF_RE.search(text) for text in _iter_str_values(raw))
+    raw_str = raw if isinstance(raw, str) else str(raw)
+    return bool(raw_str) and _OLLAMA_REF_RE.search(raw_str) is not None
+
+
+@lru_cache(maxsize=128)
+def _is_ollama_tool(tool_name: str) -> bool:
+    """Check whether a tool name looks like an Ollama Web Search MCP tool"""
+    return _OLLAMA_TOOL_RE.search(tool_name) is not None
+
+
+# Sentinel for "attribute absent", so a present-but-None attribute still counts
+# as found (as with hasattr) without a second lookup
+_MISSING = object()
+_NAME_ATTRS = ('name', '__name__')
+
+
+def _present_attr(obj: Any, names: tuple) -> Any:
+    """Return the value of the first attribute in names that exists, or _MISSING"""
+    for name in names:
+        value = getattr(obj, name, _MISSING)
+        if value is not _MISSING:
+            return value
+    return _MISSING
+
+
+def _tool_name(tool: Any) -> Optional[str]:
+    """Get a tool's raw name from a CrewAI tool, a function or any other object"""
+    name = _present_attr(tool, _NAME_ATTRS)
+    if name is not _MISSING:
+        return name
+    func = getattr(tool, 'function', _MISSING)
+    if func is not _MISSING:
+        # Tool might wrap a function
+        return getattr(func, '__name__', None)
+    return str(tool)
+
+
+def _tool_obj_name(tool_obj: Any) -> Optional[str]:
+    """Get the tool name from the .tool of an AgentAction-like tool call"""
+    name = _present_attr(tool_obj, _NAME_ATTRS)
+    if name is not _MISSING:
+        return name
+    func = getattr(tool_obj, 'function', _MISSING)
+    if func is not _MISSING:
+        # Some tools have function attribute
+        name = _present_attr(func, _NAME_ATTRS)
+        return None if name is _MISSING else name
+    desc = getattr(tool_obj, 'description', _MISSING)
+    if desc is not _MISSING:
+        # Described tool objects are identified by their string form
+        return str(tool_obj) if desc else None
+    nested_tool = getattr(tool_obj, 'tool', _MISSING)
+    if nested_tool is not _MISSING:
+        # Nested tool object
+        name = _present_attr(nested_tool, _NAME_ATTRS)
+        if name is not _MISSING:
+            return name
+        return str(nested_tool) if nested_tool else None
+    return str(tool_obj) if tool_obj else None
+
+
+def _tool_call_name(tc: Any) -> Optional[str]:
+    """Get the tool name from a tool call given as a dict, AgentAction or tool object"""
+    if isinstance(tc, dict):
+        # Try multiple possible keys
+        return tc.get('tool') or tc.get('name') or tc.get('tool_name')
+    tool_obj = getattr(tc, 'tool', _MISSING)
+    if tool_obj is not _MISSING:
+        # AgentAction object has .tool attribute
+        return _tool_obj_name(tool_obj)
+    name = getattr(tc, 'name', _MISSING)
+    if name is not _MISSING:
+        # Direct tool name attribute
+        return name
+    action = getattr(tc, 'action', _MISSING)
+    if action is not _MISSING:
+        # Some action objects have action attribute
+        if not action:
+            return None
+        name = getattr(action, 'name', _MISSING)
+        return str(action) if name is _MISSING else name
+    func = getattr(tc, 'function', _MISSING)
+    if func is not _MISSING:
+        # Function-based tool
+        name = _present_attr(func, _NAME_ATTRS)
+        return None if name is _MISSING else name
+    return None
+
+
+# id(agent) -> (agent.tools, len(agent.tools), cleaned tool names). The tools
+# list and its length are compared on lookup so lazily loaded MCP tools are
+# picked up; entries are dropped by weakref.finalize when the agent is collected
+_tool_names_cache: Dict[int, tuple] = {}
+
+
+def _agent_tool_names(agent: Any) -> Tuple[str, ...]:
+    """Get the cleaned names of an agent's tools, cached per agent object"""
+    tools = getattr(agent, 'tools', None)
+    key = id(agent)
+    cached = _tool_names_cache.get(key)
+    if cached is not None and cached[0] is tools and cached[1] == len(_as_iter(tools)):
+        return cached[2]
+    names = tuple(
+        _clean_tool_name(tool_name)
+        for tool_name in map(_tool_name, _as_iter(tools))
+        if tool_name
+    )
+    if cached is None:
+        try:
+            weakref.finalize(agent, _tool_names_cache.pop, key, None)
+        except TypeError:
+            # Not weak-referenceable, so it cannot be cached safely by id
+            return names
+    _tool_names_cache[key] = (tools, len(_as_iter(tools)), names)
+    return names
+
 
 def _identify_agent_id(agent_role: str, task_desc: str, task: Any) -> str:
     """
@@ -63,7 +439,7 @@ def _identify_agent_id(agent_role: str, task_desc: str, task: Any) -> str:
         return AGENT_ROLE_TO_ID[agent_role]
     
     # Second try: Check if agent_role is already an ID
-    if agent_role and agent_role in AGENT_ROLE_TO_ID.values():
+    if agent_role and agent_role in _AGENT_ID_VALUES:
         return agent_role
     
     # Third try: Extract from task name
@@ -78,42 +454,93 @@ def _identify_agent_id(agent_role: str, task_desc: str, task: Any) -> str:
             desc = task.description
             if desc:
                 # Look for task name patterns
-                for task_key in TASK_NAME_TO_AGENT_ID:
-                    if task_key.replace('_', ' ') in desc.lower() or task_key in desc.lower():
-                        return TASK_NAME_TO_AGENT_ID[task_key]
+                desc_lower = desc.lower()
+                for task_key, task_key_spaced, agent_id in _TASK_NAME_VARIANTS:
+                    if task_key_spaced in desc_lower or task_key in desc_lower:
+                        return agent_id
         
         if task_name:
             # Check if task_name matches any known task
+            task_name_lower = task_name.lower()
             for task_key, agent_id in TASK_NAME_TO_AGENT_ID.items():
-                if task_key in task_name.lower() or task_name.lower() in task_key:
+                if task_key in task_name_lower or task_name_lower in task_key:
                     return agent_id
     
     # Fourth try: Extract from task description keywords
     if task_desc and task_desc != 'Unknown':
-        task_lower = task_desc.lower()
-        if 'query' in task_lower and ('analysis' in task_lower or 'analyze' in task_lower):
-            return 'query_analyzer'
-        elif 'policy' in task_lower or 'scheme' in task_lower:
-            return 'policy_researcher'
-        elif 'crop' in task_lower or 'cultivation' in task_lower:
-            return 'crop_specialist'
-        elif 'pest' in task_lower or 'disease' in task_lower:
-            return 'pest_advisor'
-        elif 'market' in task_lower or 'msp' in task_lower or 'price' in task_lower:
-            return 'market_analyst'
-        elif 'non-ap' in task_lower or 'non ap' in task_lower or 'web search' in task_lower:
-            return 'non_ap_researcher'
-        elif 'synthesize' in task_lower or 'response' in task_lower or 'final' in task_lower:
-            return 'response_synthesizer'
-        elif 'pdf' in task_lower or 'document' in task_lower:
-            return 'pdf_processor_agent'  # PDF processing uses CrewAI agent with PDF MCP tool
-        elif 'calculation' in task_lower or 'calculate' in task_lower:
-            return 'calculator_agent'  # Calculations use ADK agent
+        return _agent_id_from_description(task_desc)
     
     # If all else fails, return None (don't track as 'Unknown')
     return None
 
 
+# Set STEP_TRACKING=0 to make step_callback a no-op (task_callback still tracks
+# agents), and MCP_VERBOSE=0 to skip the MCP agent tool inspection
+_TRACING_ENABLED = os.getenv("STEP_TRACKING", "1") != "0"
+_MCP_VERBOSE = os.getenv("MCP_VERBOSE", "1") != "0"
+
+# Minimum seconds between MCP tool inspections of the same agent; the output is
+# identical on every step of a multi-iteration agent
+MCP_INSPECT_INTERVAL = 5.0
+_mcp_inspected_at: Dict[str, float] = {}
+
+
+def _should_inspect_mcp_agent(agent_id: str) -> bool:
+    """Return True (and record the time) if agent_id is due for MCP inspection"""
+    now = time.monotonic()
+    last = _mcp_inspected_at.get(agent_id)
+    if last is not None and now - last < MCP_INSPECT_INTERVAL:
+        return False
+    _mcp_inspected_at[agent_id] = now
+    return True
+
+
+def _discover_and_track_agent_tools(agent: Any, agent_id: str, tracker: Any) -> List[str]:
+    """
+    Track an agent's available tools when its steps report no tool calls
+    
+    MCP agents get the Ollama Web Search MCP tool (whether or not its tools
+    have loaded yet); every agent gets its assigned tools, since CrewAI agents
+    with tools typically use them.
+    
+    Args:
+        agent: CrewAI agent object
+        agent_id: Identified agent ID
+        tracker: Execution tracker to record the tools in
+        
+    Returns:
+        Display names of the tracked tools
+    """
+    tool_names = _agent_tool_names(agent)
+    tracked = []
+    
+    # Check for MCP tools first
+    mcps = getattr(agent, 'mcps', None)
+    if mcps:
+        logger.info("🔍 Agent %s has MCP servers configured: %s", agent_id, mcps)
+        # For MCP agents, we expect Ollama Web Search MCP tools
+        if agent_id in _MCP_AGENT_IDS:
+            logger.info("📡 MCP Agent detected: %s - Expected Ollama Web Search MCP tools", agent_id)
+            mcp_tool_names = [tool_name for tool_name in tool_names if _is_ollama_tool(tool_name)]
+            if mcp_tool_names:
+                logger.info("🔍 Discovered Ollama Web Search MCP tool(s): %s", mcp_tool_names)
+            else:
+                logger.info("No Ollama Web Search MCP tools on %s yet (tools may be lazy-loaded); tracking the expected tool", agent_id)
+            # All Ollama tools share one display name
+            tracked.append(get_tool_display_name('Ollama Web Search MCP'))
+    
+    # Check for regular tools
+    if tool_names:
+        logger.info("Fallback: Tracking available tools for %s: %s", agent_id, list(tool_names))
+        tracked.extend(get_tool_display_name(tool_name) for tool_name in tool_names if tool_name != 'Unknown')
+    
+    if tracked:
+        tracked = list(dict.fromkeys(tracked))
+        tracker.track_tools(agent_id, tracked)
+        logger.info("✓ Tracked %d tool(s) (fallback) for agent: %s: %s", len(tracked), agent_id, tracked)
+    return tracked
+
+
 def step_callback(step: Dict[str, Any]) -> None:
     """
     Callback function called after each step of every agent
@@ -125,248 +552,108 @@ def step_callback(step: Dict[str, Any]) -> None:
               - output: Step output
               - iterations: Current iteration number
     """
+    if not _TRACING_ENABLED:
+        return
     try:
         tracker = get_tracker()
+        # Level checks done once per step; disabled log calls then cost nothing
+        debug_enabled = logger.isEnabledFor(logging.DEBUG)
+        info_enabled = logger.isEnabledFor(logging.INFO)
         
         # Debug: Log step structure to understand what CrewAI passes
-        logger.debug(f"Step callback received - Type: {type(step)}, Keys: {list(step.keys()) if isinstance(step, dict) else 'Not a dict'}")
-        
-        # Safely extract agent role - handle both dict and object types with multiple fallbacks
-        agent_role = None
-        agent = None
+        if debug_enabled:
+            logger.debug("Step callback received - Type: %s, Keys: %s", type(step), list(step.keys()) if isinstance(step, dict) else 'Not a dict')
         
-        # Try multiple ways to get agent
-        if isinstance(step, dict):
-            agent = step.get('agent') or step.get('agent_role') or step.get('agent_name')
-        else:
-            agent = (getattr(step, 'agent', None) or 
-                    getattr(step, 'agent_role', None) or 
-                    getattr(step, 'agent_name', None))
+        # Safely extract agent, role, task and tool calls - dispatched once on the step's type
+        agent, agent_role, task, task_desc, tool_calls, iteration = _extract_step_context(step)
         
         if agent:
-            if isinstance(agent, dict):
-                agent_role = (agent.get('role') or 
-                            agent.get('agent_role') or 
-                            agent.get('name') or 
-                            agent.get('agent_name'))
-            elif hasattr(agent, 'role'):
-                agent_role = agent.role
-            elif hasattr(agent, 'agent_role'):
-                agent_role = agent.agent_role
-            elif hasattr(agent, 'name'):
-                agent_role = agent.name
-            elif hasattr(agent, 'backstory'):
-                # Try to get role from agent object attributes
-                agent_role = (getattr(agent, 'role', None) or 
-                            getattr(agent, 'agent_role', None) or
-                            getattr(agent, 'name', None))
-            
-            # Log available tools and track them if agent executed
-            if hasattr(agent, 'tools') and agent.tools:
-                logger.debug(f"Agent {agent_role} has {len(agent.tools)} available tools")
+            # Log available tools (debug only; tracking happens below)
+            if debug_enabled and hasattr(agent, 'tools') and agent.tools:
+                logger.debug("Agent %s has %d available tools", agent_role, len(agent.tools))
                 # Log tool names for debugging
-                tool_names = []
-                for tool in agent.tools:
-                    tool_name = None
-                    if hasattr(tool, 'name'):
-                        tool_name = tool.name
-                    elif hasattr(tool, '__name__'):
-                        tool_name = tool.__name__
-                    elif hasattr(tool, 'function'):
-                        # Tool might be a function
-                        func = tool.function if hasattr(tool, 'function') else tool
-                        if hasattr(func, '__name__'):
-                            tool_name = func.__name__
-                    else:
-                        tool_name = str(tool)
-                    
-                    if tool_name:
-                        # Clean up tool name
-                        tool_name = tool_name.replace('<function ', '').replace(' at 0x', '')
-                        tool_name = tool_name.split(' at ')[0].split('>')[0].strip()
-                        tool_names.append(tool_name)
-                
-                logger.debug(f"Available tools: {tool_names}")
-                
-                # If we have an identified agent_id and tools, track them as potentially used
-                # This is a fallback when tool_calls aren't in the step object
-                # We'll track all available tools for the agent (CrewAI agents typically use their tools)
-                if agent_id and agent_id not in ['Unknown', 'unknown_agent'] and tool_names:
-                    # Only track if we haven't already tracked tools for this agent in this step
-                    # This prevents double-tracking
-                    logger.debug(f"Agent {agent_id} has tools available: {tool_names}")
-                    # Note: We'll track actual usage from tool_calls if available, otherwise
-                    # we'll use this as a fallback after checking tool_calls below
-        
-        # If still no agent_role, try to extract from step directly
-        if not agent_role:
-            if isinstance(step, dict):
-                agent_role = (step.get('agent_role') or 
-                            step.get('agent_name') or
-                            step.get('role'))
-            else:
-                agent_role = (getattr(step, 'agent_role', None) or
-                            getattr(step, 'agent_name', None) or
-                            getattr(step, 'role', None))
-        
-        # Safely extract task description - handle both dict and object types with multiple fallbacks
-        task_desc = None
-        task = None
-        
-        # Try multiple ways to get task
-        if isinstance(step, dict):
-            task = step.get('task') or step.get('task_description') or step.get('task_name')
-        else:
-            task = (getattr(step, 'task', None) or 
-                   getattr(step, 'task_description', None) or
-                   getattr(step, 'task_name', None))
-        
-        if task:
-            if isinstance(task, dict):
-                task_desc = (task.get('description') or 
-                           task.get('task_description') or
-                           task.get('name') or
-                           task.get('task_name'))
-                if task_desc:
-                    task_desc = task_desc[:100]
-            elif hasattr(task, 'description'):
-                task_desc = (task.description[:100] if task.description else None)
-            elif hasattr(task, 'task_description'):
-                task_desc = (task.task_description[:100] if task.task_description else None)
-            elif hasattr(task, 'name'):
-                task_desc = (task.name[:100] if task.name else None)
-        
-        # If still no task_desc, try to extract from step directly
-        if not task_desc:
-            if isinstance(step, dict):
-                task_desc = (step.get('task_description') or 
-                           step.get('task_name') or
-                           step.get('description'))
-                if task_desc:
-                    task_desc = str(task_desc)[:100]
-            else:
-                task_desc = (getattr(step, 'task_description', None) or
-                           getattr(step, 'task_name', None) or
-                           getattr(step, 'description', None))
-                if task_desc:
-                    task_desc = str(task_desc)[:100]
+                logger.debug("Available tools: %s", list(_agent_tool_names(agent)))
+                # Note: Actual usage is tracked from tool_calls if available, otherwise
+                # the available tools are tracked as a fallback after checking tool_calls below
         
         # Use 'Unknown' as fallback for logging, but don't use it for identification
         agent_role_str = agent_role if agent_role else 'Unknown'
         task_desc_str = task_desc if task_desc else 'Unknown'
         
-        # Safely extract iteration count
-        if isinstance(step, dict):
-            iteration = step.get('iterations', 0)
-        else:
-            iteration = getattr(step, 'iterations', 0)
-        
         # Track agent execution - improve identification
         agent_id = _identify_agent_id(agent_role_str, task_desc_str, task)
         
         # Only track if we have a valid agent_id (not 'Unknown' or 'unknown_agent')
-        if agent_id and agent_id not in ['Unknown', 'unknown_agent']:
+        if agent_id and agent_id not in _BAD_AGENT_IDS:
             tracker.track_agent(agent_id)
             
             # Special logging for MCP agents to verify tool availability
-            if agent_id in ['market_analyst', 'non_ap_researcher']:
-                logger.info(f"📡 MCP Agent executing: {agent_role_str} (ID: {agent_id})")
+            # The inspection below is purely diagnostic, so skip it when INFO is off
+            # and repeat it at most once per MCP_INSPECT_INTERVAL for each agent
+            if info_enabled and _MCP_VERBOSE and agent_id in _MCP_AGENT_IDS and _should_inspect_mcp_agent(agent_id):
+                logger.info("📡 MCP Agent executing: %s (ID: %s)", agent_role_str, agent_id)
                 # Try to check if agent has MCP tools available
                 if agent:
                     try:
                         if hasattr(agent, 'mcps') and agent.mcps:
-                            mcp_count = len(agent.mcps) if isinstance(agent.mcps, (list, tuple)) else 1
-                            logger.info(f"  ✓ MCP servers configured: {mcp_count} server(s)")
+                            mcps = _as_iter(agent.mcps)
+                            logger.info("  ✓ MCP servers configured: %d server(s)", len(mcps))
                             # Log MCP server details
-                            for i, mcp in enumerate(agent.mcps if isinstance(agent.mcps, (list, tuple)) else [agent.mcps]):
+                            for i, mcp in enumerate(mcps):
                                 if hasattr(mcp, 'command'):
                                     # MCPServerStdio structured config
                                     cmd = getattr(mcp, 'command', 'unknown')
                                     args = getattr(mcp, 'args', [])
-                                    logger.info(f"    MCP Server {i+1}: stdio transport - command: {cmd}, args: {args}")
+                                    logger.info("    MCP Server %d: stdio transport - command: %s, args: %s", i + 1, cmd, args)
                                 elif isinstance(mcp, list):
                                     # Command format
-                                    logger.info(f"    MCP Server {i+1}: command format - {mcp}")
+                                    logger.info("    MCP Server %d: command format - %s", i + 1, mcp)
+                                elif not debug_enabled:
+                                    continue
                                 elif hasattr(mcp, 'url'):
-                                    logger.debug(f"    MCP Server {i+1}: {str(mcp.url)[:80]}...")
+                                    logger.debug("    MCP Server %d: %s...", i + 1, _SHORT_REPR.repr(mcp.url))
                                 else:
-                                    logger.debug(f"    MCP Server {i+1}: {type(mcp).__name__} - {str(mcp)[:80]}")
+                                    logger.debug("    MCP Server %d: %s - %s", i + 1, type(mcp).__name__, _SHORT_REPR.repr(mcp))
                         else:
-                            logger.warning(f"  ⚠ Agent has no 'mcps' attribute or MCP servers not configured")
+                            logger.warning("  ⚠ Agent has no 'mcps' attribute or MCP servers not configured")
                         
                         # Check tools - this is critical for MCP agents
                         if hasattr(agent, 'tools'):
                             if agent.tools:
-                                tool_count = len(agent.tools) if isinstance(agent.tools, (list, tuple)) else 1
-                                all_tool_names = []
-                                for t in (agent.tools if isinstance(agent.tools, (list, tuple)) else [agent.tools]):
-                                    tool_name = None
-                                    if hasattr(t, 'name'):
-                                        tool_name = getattr(t, 'name', 'unknown')
-                                    elif hasattr(t, '__name__'):
-                                        tool_name = getattr(t, '__name__', 'unknown')
-                                    elif callable(t):
-                                        tool_name = getattr(t, '__name__', 'callable')
-                                    else:
-                                        tool_name = str(t)[:50]
-                                    all_tool_names.append(tool_name)
+                                tool_count = len(_as_iter(agent.tools))
+                                all_tool_names = _agent_tool_names(agent)
                                 
-                                ollama_tools = [name for name in all_tool_names if 'web_search' in name.lower() or 'web_fetch' in name.lower() or ('ollama' in name.lower() and 'search' in name.lower())]
-                                logger.info(f"  ✓ Agent has {tool_count} tool(s) available during execution")
-                                logger.info(f"  All tools: {', '.join(all_tool_names[:10])}")
+                                ollama_tools = [name for name in all_tool_names if _is_ollama_tool(name)]
+                                logger.info("  ✓ Agent has %d tool(s) available during execution", tool_count)
+                                logger.info("  All tools: %s", ', '.join(all_tool_names[:10]))
                                 if ollama_tools:
-                                    logger.info(f"  ✅ Ollama Web Search MCP tools found: {', '.join(ollama_tools)}")
+                                    logger.info("  ✅ Ollama Web Search MCP tools found: %s", ', '.join(ollama_tools))
                                 else:
-                                    logger.error(f"  ❌ CRITICAL: No Ollama Web Search MCP tools found in {tool_count} available tools!")
-                                    logger.error(f"    This means the agent cannot use web_search or web_fetch tools")
-                                    logger.error(f"    Available tools: {', '.join(all_tool_names[:10])}")
+                                    logger.error("  ❌ CRITICAL: No Ollama Web Search MCP tools found in %d available tools!", tool_count)
+                                    logger.error("    This means the agent cannot use web_search or web_fetch tools")
+                                    logger.error("    Available tools: %s", ', '.join(all_tool_names[:10]))
                             else:
-                                logger.error(f"  ❌ CRITICAL: Agent tools list is EMPTY during execution!")
-                                logger.error(f"    MCP tools should be available but are not. Check MCP server startup.")
+                                logger.error("  ❌ CRITICAL: Agent tools list is EMPTY during execution!")
+                                logger.error("    MCP tools should be available but are not. Check MCP server startup.")
                         else:
-                            logger.error(f"  ❌ CRITICAL: Agent has no 'tools' attribute during execution!")
-                            logger.error(f"    MCP tools cannot be accessed. This indicates a problem with MCP integration.")
+                            logger.error("  ❌ CRITICAL: Agent has no 'tools' attribute during execution!")
+                            logger.error("    MCP tools cannot be accessed. This indicates a problem with MCP integration.")
                     except Exception as e:
-                        logger.error(f"  ❌ Could not inspect agent tools: {e}")
-                        import traceback
-                        logger.debug(traceback.format_exc())
+                        logger.error("  ❌ Could not inspect agent tools: %s", e)
+                        if debug_enabled:
+                            logger.debug("MCP tool inspection failed", exc_info=True)
             
-            logger.info(f"Step completed - Agent: {agent_role_str} (ID: {agent_id}), Iteration: {iteration}")
-            logger.debug(f"Task: {task_desc_str}...")
+            logger.info("Step completed - Agent: %s (ID: %s), Iteration: %s", agent_role_str, agent_id, iteration)
+            logger.debug("Task: %s...", task_desc_str)
         else:
             # Log warning with more context for debugging
-            logger.warning(f"Could not identify agent - role: {agent_role_str}, task: {task_desc_str[:50]}")
-            logger.debug(f"Step structure: {type(step)}, Agent type: {type(agent) if agent else 'None'}, Task type: {type(task) if task else 'None'}")
+            logger.warning("Could not identify agent - role: %s, task: %s", agent_role_str, task_desc_str[:50])
+            if debug_enabled:
+                logger.debug("Step structure: %s, Agent type: %s, Task type: %s", type(step), type(agent) if agent else 'None', type(task) if task else 'None')
             # Don't track unknown agents - they cause display issues
             return  # Exit early if agent cannot be identified
         
-        # Track tool usage if present - handle both dict and object types
-        # CrewAI may pass tools in different formats: tool_calls, actions, or tool_uses
-        tool_calls = None
-        if isinstance(step, dict):
-            # Try multiple possible keys for tool information
-            tool_calls = (step.get('tool_calls') or 
-                         step.get('actions') or 
-                         step.get('tool_uses') or
-                         step.get('tools'))
-        else:
-            # Try multiple attributes
-            tool_calls = (getattr(step, 'tool_calls', None) or
-                         getattr(step, 'actions', None) or
-                         getattr(step, 'tool_uses', None) or
-                         getattr(step, 'tools', None))
-        
-        # Also check if step has output with tool information
-        if not tool_calls:
-            output = step.get('output') if isinstance(step, dict) else getattr(step, 'output', None)
-            if output:
-                if isinstance(output, dict):
-                    tool_calls = output.get('tool_calls') or output.get('actions')
-                elif hasattr(output, 'tool_calls'):
-                    tool_calls = output.tool_calls
-                elif hasattr(output, 'actions'):
-                    tool_calls = output.actions
-        
+        # Track tool usage if present (tool_calls came from the step or its output)
         # Also check task object for tool information
         if not tool_calls and task:
             if isinstance(task, dict):
@@ -379,73 +666,18 @@ def step_callback(step: Dict[str, Any]) -> None:
                 task_tools = None
             
             if task_tools:
-                logger.debug(f"Found tools in task object: {task_tools}")
+                logger.debug("Found tools in task object: %s", task_tools)
                 # Note: task.tools shows available tools, not necessarily used ones
         
         if tool_calls:
-            tool_count = len(tool_calls) if isinstance(tool_calls, (list, tuple)) else 1
-            logger.info(f"🔧 Found {tool_count} tool call(s) for agent: {agent_role} (ID: {agent_id})")
-            tool_names = []
             # Handle both list and single tool call
-            if not isinstance(tool_calls, (list, tuple)):
-                tool_calls = [tool_calls]
+            tool_calls = _as_iter(tool_calls)
+            logger.info("🔧 Found %d tool call(s) for agent: %s (ID: %s)", len(tool_calls), agent_role, agent_id)
+            tool_names = []
             
             for tc in tool_calls:
-                tool_name = None
-                
                 # Handle both dict and AgentAction object types
-                if isinstance(tc, dict):
-                    # Try multiple possible keys
-                    tool_name = tc.get('tool') or tc.get('name') or tc.get('tool_name')
-                elif hasattr(tc, 'tool'):
-                    # AgentAction object has .tool attribute
-                    tool_obj = tc.tool
-                    if hasattr(tool_obj, 'name'):
-                        tool_name = tool_obj.name
-                    elif hasattr(tool_obj, '__name__'):
-                        tool_name = tool_obj.__name__
-                    elif hasattr(tool_obj, 'function'):
-                        # Some tools have function attribute
-                        func = tool_obj.function
-                        if hasattr(func, 'name'):
-                            tool_name = func.name
-                        elif hasattr(func, '__name__'):
-                            tool_name = func.__name__
-                    elif hasattr(tool_obj, 'description'):
-                        # Extract from description if available
-                        desc = tool_obj.description
-                        if desc:
-                            # Try to extract tool name from description
-                            tool_name = str(tool_obj)
-                    elif hasattr(tool_obj, 'tool'):
-                        # Nested tool object
-                        nested_tool = tool_obj.tool
-                        if hasattr(nested_tool, 'name'):
-                            tool_name = nested_tool.name
-                        elif hasattr(nested_tool, '__name__'):
-                            tool_name = nested_tool.__name__
-                        else:
-                            tool_name = str(nested_tool) if nested_tool else None
-                    else:
-                        tool_name = str(tool_obj) if tool_obj else None
-                elif hasattr(tc, 'name'):
-                    # Direct tool name attribute
-                    tool_name = tc.name
-                elif hasattr(tc, 'action'):
-                    # Some action objects have action attribute
-                    action = getattr(tc, 'action', None)
-                    if action:
-                        if hasattr(action, 'name'):
-                            tool_name = action.name
-                        else:
-                            tool_name = str(action)
-                elif hasattr(tc, 'function'):
-                    # Function-based tool
-                    func = tc.function
-                    if hasattr(func, 'name'):
-                        tool_name = func.name
-                    elif hasattr(func, '__name__'):
-                        tool_name = func.__name__
+                tool_name = _tool_call_name(tc)
                 
                 # Fallback to string representation
                 if not tool_name:
@@ -454,444 +686,344 @@ def step_callback(step: Dict[str, Any]) -> None:
                 # Clean up tool name - remove common prefixes/suffixes
                 if tool_name and tool_name != 'Unknown':
                     # Remove function call indicators
-                    tool_name = tool_name.replace('<function ', '').replace(' at 0x', '')
-                    tool_name = tool_name.split(' at ')[0].split('>')[0].strip()
+                    tool_name = _clean_tool_name(tool_name)
                     
                     # Detect Ollama Web Search MCP tools (web_search, web_fetch, or ollama-related)
-                    tool_name_lower = tool_name.lower()
-                    is_ollama_tool = (
-                        'web_search' in tool_name_lower or 
-                        'web_fetch' in tool_name_lower or
-                        ('ollama' in tool_name_lower and 'search' in tool_name_lower) or
-                        tool_name_lower == 'web_search' or
-                        tool_name_lower == 'web_fetch'
-                    )
-                    if is_ollama_tool:
-                        logger.info(f"🔍✅ Ollama Web Search MCP tool CALLED: {tool_name} (Agent: {agent_id})")
+                    if _is_ollama_tool(tool_name):
+                        logger.info("🔍✅ Ollama Web Search MCP tool CALLED: %s (Agent: %s)", tool_name, agent_id)
                         # Normalize MCP tool names to standard display name
                         tool_name = 'Ollama Web Search MCP'
-                    elif agent_id in ['market_analyst', 'non_ap_researcher']:
+                    elif agent_id in _MCP_AGENT_IDS:
                         # Log all tool calls for MCP agents to debug
-                        logger.debug(f"  Tool called by {agent_id}: {tool_name}")
+                        logger.debug("  Tool called by %s: %s", agent_id, tool_name)
                     
                     tool_names.append(tool_name)
             
             if tool_names:
-                logger.info(f"Tools used by {agent_role} ({agent_id}): {tool_names}")
+                logger.info("Tools used by %s (%s): %s", agent_role, agent_id, tool_names)
                 
-                # Track each tool
+                # Map each tool to its display name, then track them in one batch
+                clean_tool_names = []
                 for tool_name in tool_names:
                     if tool_name and tool_name != 'Unknown':
                         # Use centralized tool name mapping
                         clean_tool_name = get_tool_display_name(tool_name)
                         
                         # Log ADK tool usage for A2A communication verification
-                        if is_adk_tool(tool_name):
-                            logger.info(f"✅ ADK tool detected: {tool_name} -> {clean_tool_name} (Agent: {agent_id})")
-                            logger.debug(f"A2A communication enabled via ADK tool: {clean_tool_name}")
-                        
-                        tracker.track_tool(agent_id, clean_tool_name)
+                        if _is_adk(tool_name):
+                            logger.info("✅ ADK tool detected: %s -> %s (Agent: %s)", tool_name, clean_tool_name, agent_id)
+                            logger.debug("A2A communication enabled via ADK tool: %s", clean_tool_name)
                         
-                        # Log tool tracking for debugging
-                        logger.info(f"✓ Tracked tool: {clean_tool_name} for agent: {agent_id} ({agent_role})")
+                        clean_tool_names.append(clean_tool_name)
+                
+                if clean_tool_names:
+                    tracker.track_tools(agent_id, clean_tool_names)
+                    logger.info("✓ Tracked %d tool(s) for agent: %s (%s): %s", len(clean_tool_names), agent_id, agent_role, clean_tool_names)
             else:
-                logger.debug(f"No tool names extracted from tool_calls for agent: {agent_role}")
+                logger.debug("No tool names extracted from tool_calls for agent: %s", agent_role)
         else:
-            logger.debug(f"No tool_calls found in step for agent: {agent_role}")
+            logger.debug("No tool_calls found in step for agent: %s", agent_role)
             
             # FALLBACK: Track agent's available tools if no tool_calls found
             # This ensures tools are displayed even if CrewAI doesn't provide tool_calls in step
-            if agent_id and agent_id not in ['Unknown', 'unknown_agent'] and agent:
+            if agent_id and agent_id not in _BAD_AGENT_IDS and agent:
                 # Check if we've already tracked tools for this agent in this execution
-                existing_tools = tracker.get_agent_tools().get(agent_id, [])
-                if not existing_tools:
-                    # Check for MCP tools first
-                    if hasattr(agent, 'mcps') and agent.mcps:
-                        logger.info(f"🔍 Agent {agent_id} has MCP servers configured: {agent.mcps}")
-                        # For MCP agents, we expect Ollama Web Search MCP tools
-                        if agent_id in ['market_analyst', 'non_ap_researcher']:
-                            logger.info(f"📡 MCP Agent detected: {agent_id} - Expected Ollama Web Search MCP tools")
-                            # Try to discover actual MCP tool names from agent
-                            try:
-                                if hasattr(agent, 'tools') and agent.tools:
-                                    mcp_tool_names = []
-                                    for tool in agent.tools:
-                                        tool_name = None
-                                        if hasattr(tool, 'name'):
-                                            tool_name = tool.name
-                                        elif hasattr(tool, '__name__'):
-                                            tool_name = tool.__name__
-                                        else:
-                                            tool_name = str(tool)
-                                        
-                                        # Check if this looks like an Ollama Web Search MCP tool
-                                        tool_name_lower = tool_name.lower() if tool_name else ''
-                                        is_ollama_tool = (
-                                            'web_search' in tool_name_lower or 
-                                            'web_fetch' in tool_name_lower or
-                                            ('ollama' in tool_name_lower and 'search' in tool_name_lower) or
-                                            tool_name_lower == 'web_search' or
-                                            tool_name_lower == 'web_fetch'
-                                        )
-                                        if is_ollama_tool:
-                                            mcp_tool_names.append(tool_name)
-                                            logger.info(f"🔍 Discovered Ollama Web Search MCP tool: {tool_name}")
-                                    
-                                    if mcp_tool_names:
-                                        # Track discovered MCP tools
-                                        for mcp_tool_name in mcp_tool_names:
-                                            clean_tool_name = get_tool_display_name('Ollama Web Search MCP')
-                                            tracker.track_tool(agent_id, clean_tool_name)
-                                            logger.info(f"✓ Tracked discovered MCP tool: {mcp_tool_name} -> {clean_tool_name} for agent: {agent_id}")
-                                    else:
-                                        # Fallback: Track expected MCP tool
-                                        clean_tool_name = get_tool_display_name('Ollama Web Search MCP')
-                                        tracker.track_tool(agent_id, clean_tool_name)
-                                        logger.info(f"✓ Tracked expected MCP tool: {clean_tool_name} for agent: {agent_id} (tools may be lazy-loaded)")
-                                else:
-                                    # Fallback: Track expected MCP tool if tools not yet loaded
-                                    clean_tool_name = get_tool_display_name('Ollama Web Search MCP')
-                                    tracker.track_tool(agent_id, clean_tool_name)
-                                    logger.info(f"✓ Tracked expected MCP tool: {clean_tool_name} for agent: {agent_id} (tools may be lazy-loaded)")
-                            except Exception as e:
-                                logger.debug(f"Could not inspect MCP tools for {agent_id}: {e}")
-                                # Fallback: Track expected MCP tool
-                                clean_tool_name = get_tool_display_name('Ollama Web Search MCP')
-                                tracker.track_tool(agent_id, clean_tool_name)
-                                logger.info(f"✓ Tracked expected MCP tool: {clean_tool_name} for agent: {agent_id} (fallback)")
-                    
-                    # Check for regular tools
-                    if hasattr(agent, 'tools') and agent.tools:
-                        agent_tools_list = []
-                        for tool in agent.tools:
-                            tool_name = None
-                            if hasattr(tool, 'name'):
-                                tool_name = tool.name
-                            elif hasattr(tool, '__name__'):
-                                tool_name = tool.__name__
-                            elif hasattr(tool, 'function'):
-                                func = tool.function if hasattr(tool, 'function') else tool
-                                if hasattr(func, '__name__'):
-                                    tool_name = func.__name__
-                            else:
-                                tool_name = str(tool)
-                            
-                            if tool_name:
-                                # Clean up tool name
-                                tool_name = tool_name.replace('<function ', '').replace(' at 0x', '')
-                                tool_name = tool_name.split(' at ')[0].split('>')[0].strip()
-                                agent_tools_list.append(tool_name)
-                        
-                        # Track available tools as fallback (CrewAI agents with tools typically use them)
-                        if agent_tools_list:
-                            logger.info(f"Fallback: Tracking available tools for {agent_id}: {agent_tools_list}")
-                            for tool_name in agent_tools_list:
-                                if tool_name and tool_name != 'Unknown':
-                                    clean_tool_name = get_tool_display_name(tool_name)
-                                    tracker.track_tool(agent_id, clean_tool_name)
-                                    logger.info(f"✓ Tracked tool (fallback): {clean_tool_name} for agent: {agent_id}")
+                if not tracker.get_agent_tools().get(agent_id):
+                    _discover_and_track_agent_tools(agent, agent_id, tracker)
             
             # Log step contents for debugging (only in debug mode to avoid spam)
-            if logger.isEnabledFor(logging.DEBUG):
+            if debug_enabled:
                 if isinstance(step, dict):
-                    logger.debug(f"Step keys: {list(step.keys())}")
+                    logger.debug("Step keys: %s", list(step.keys()))
                     # Check for any tool-related keys
                     tool_keys = [k for k in step.keys() if 'tool' in k.lower() or 'action' in k.lower()]
                     if tool_keys:
-                        logger.debug(f"Found tool-related keys in step: {tool_keys}")
+                        logger.debug("Found tool-related keys in step: %s", tool_keys)
                         # Try to extract from these keys
                         for key in tool_keys:
                             value = step.get(key)
                             if value:
-                                logger.debug(f"Found value in {key}: {type(value)} - {str(value)[:200]}")
+                                logger.debug("Found value in %s: %s - %s", key, type(value), _DEBUG_REPR.repr(value))
                 else:
                     # Check object attributes
                     attrs = [attr for attr in dir(step) if 'tool' in attr.lower() or 'action' in attr.lower()]
                     if attrs:
-                        logger.debug(f"Found tool-related attributes: {attrs}")
+                        logger.debug("Found tool-related attributes: %s", attrs)
                         for attr in attrs:
                             try:
                                 value = getattr(step, attr, None)
                                 if value:
-                                    logger.debug(f"Found value in {attr}: {type(value)} - {str(value)[:200]}")
+                                    logger.debug("Found value in %s: %s - %s", attr, type(value), _DEBUG_REPR.repr(value))
                             except Exception:
                                 pass
         
         # Log errors if present - handle both dict and object types
-        error = None
-        if isinstance(step, dict):
-            error = step.get('error')
-        else:
-            error = getattr(step, 'error', None)
+        error = _extract_first(step, ('error',))
         
         if error:
-            logger.error(f"Error in step: {error}")
+            logger.error("Error in step: %s", error)
             
     except Exception as e:
-        logger.error(f"Error in step_callback: {e}")
+        logger.error("Error in step_callback: %s", e)
 
 
-def task_callback(output: TaskOutput) -> None:
+def _record_task_output(output: TaskOutput) -> None:
     """
-    Callback function called after the completion of each task
-    Also stores task outputs in StateManager for ADK agent access (A2A communication)
+    Track, validate and store a completed task's output (see task_callback)
     
     Args:
         output: TaskOutput object containing task results
     """
-    try:
-        tracker = get_tracker()
-        task_desc = output.description[:100] if output.description else 'Unknown'
-        agent_role = output.agent if hasattr(output, 'agent') else 'Unknown'
-        
-        # Track agent execution - improve identification
-        agent_id = _identify_agent_id(agent_role, task_desc, None)
+    # Imported on first use so step-level monitoring does not load the ADK
+    # agent module (google.generativeai, numpy) or the schema models
+    from policy_navigator.adk.adk_agent import get_state_manager, A2AMessage
+    from policy_navigator.models.schemas import QueryAnalysis
+    
+    tracker = get_tracker()
+    debug_enabled = logger.isEnabledFor(logging.DEBUG)
+    task_desc = output.description[:100] if output.description else 'Unknown'
+    agent_role = getattr(output, 'agent', 'Unknown')
+    
+    # Track agent execution - improve identification
+    agent_id = _identify_agent_id(agent_role, task_desc, None)
+    
+    # Only track if we have a valid agent_id
+    if agent_id and agent_id not in _BAD_AGENT_IDS:
+        tracker.track_agent(agent_id)
+    else:
+        logger.warning(f"Could not identify agent in task_callback - role: {agent_role}, task: {task_desc[:50]}")
+        # Don't track unknown agents
+        return  # Exit early if agent cannot be identified
+    
+    logger.info(f"Task completed - Agent: {agent_role} (ID: {agent_id})")
+    logger.info(f"Task: {task_desc}...")
+    
+    # Tools tracked for this agent so far (one snapshot; tools are only
+    # tracked below when the output reports them, and the fallback then skips)
+    agent_tools = tracker.get_agent_tools().get(agent_id, [])
+    
+    # Validate MCP agent tool usage - check both tracked tools and output
+    if agent_id in _MCP_AGENT_IDS:
+        # Also check output for tool information
+        ollama_tool_in_output = False
+        raw = getattr(output, 'raw', _MISSING)
+        if raw is not _MISSING:
+            try:
+                ollama_tool_in_output = _has_ollama_ref(raw)
+                if ollama_tool_in_output:
+                    logger.info(f"✓ {agent_id}: Found Ollama Web Search MCP references in output (tool may have been used)")
+            except Exception as e:
+                logger.debug("Could not check output for Ollama Web Search MCP references: %s", e)
         
-        # Only track if we have a valid agent_id
-        if agent_id and agent_id not in ['Unknown', 'unknown_agent']:
-            tracker.track_agent(agent_id)
-        else:
-            logger.warning(f"Could not identify agent in task_callback - role: {agent_role}, task: {task_desc[:50]}")
-            # Don't track unknown agents
-            return  # Exit early if agent cannot be identified
+        # Check if any Ollama Web Search MCP tools were actually used (not just tracked as available)
+        ollama_tools_used = [tool for tool in agent_tools if _OLLAMA_REF_RE.search(tool)]
+        ollama_tool_used = bool(ollama_tools_used)
         
-        logger.info(f"Task completed - Agent: {agent_role} (ID: {agent_id})")
-        logger.info(f"Task: {task_desc}...")
+        if not ollama_tool_used and not ollama_tool_in_output:
+            logger.warning(f"⚠️ {agent_id}: Task completed but Ollama Web Search MCP tools do NOT appear to have been called!")
+            logger.warning(f"  Tracked tools: {agent_tools if agent_tools else 'None'}")
+            logger.warning(f"  The agent MUST use Ollama Web Search MCP tools for real-time data.")
+            logger.warning(f"  Please verify that OLLAMA_API_KEY is set and MCP server is accessible.")
+        elif ollama_tool_used:
+            logger.info(f"✓ {agent_id}: Ollama Web Search MCP tools were tracked as used: {ollama_tools_used}")
+        elif ollama_tool_in_output:
+            logger.info(f"✓ {agent_id}: Ollama Web Search MCP tool usage detected in output (may not have been tracked in step_callback)")
+        elif not agent_tools:
+            logger.warning(f"⚠️ {agent_id}: No tools tracked - Ollama Web Search MCP tools may not be available or were not used!")
+    
+    # Try to extract tools from task output if available
+    # Some CrewAI versions store tool usage in output
+    tools_tracked_from_output = False
+    output_tool_calls = getattr(output, 'tool_calls', None)
+    if output_tool_calls:
+        logger.info(f"Found tools in task output: {output_tool_calls}")
+        for tool_call in output_tool_calls:
+            if isinstance(tool_call, dict):
+                tool_name = tool_call.get('tool') or tool_call.get('name')
+            else:
+                tool_obj = getattr(tool_call, 'tool', _MISSING)
+                if tool_obj is not _MISSING:
+                    tool_name = getattr(tool_obj, 'name', None) or getattr(tool_obj, '__name__', None)
+                else:
+                    tool_name = getattr(tool_call, 'name', None)
+            
+            if tool_name:
+                clean_tool_name = get_tool_display_name(tool_name)
+                tracker.track_tool(agent_id, clean_tool_name)
+                tools_tracked_from_output = True
+                logger.info(f"✓ Tracked tool from task output: {clean_tool_name} for agent: {agent_id}")
+    
+    # FALLBACK: If no tools tracked from output, check if agent has tools assigned
+    # This ensures tools are displayed in the frontend even if CrewAI doesn't report usage
+    if not tools_tracked_from_output:
+        # TaskOutput only carries the agent role, not the agent object, so
+        # use agent_id to determine expected tools
+        # This is a fallback to ensure tools are shown in UI
+        if agent_id:
+            # Check if we've already tracked tools for this agent
+            if not agent_tools:
+                expected_tools = _EXPECTED_TOOLS_MAP.get(agent_id, ())
+                if expected_tools:
+                    logger.info(f"Fallback: Tracking expected tools for {agent_id}: {expected_tools}")
+                    # Track the expected tool directly (already in display name format)
+                    for tool_display_name in expected_tools:
+                        tracker.track_tool(agent_id, tool_display_name)
+                        logger.info(f"✓ Tracked expected tool (fallback): {tool_display_name} for agent: {agent_id}")
+    
+    # Log output summary
+    if output.raw:
+        output_length = len(output.raw)
+        logger.info(f"Output length: {output_length} characters")
+        if debug_enabled:
+            logger.debug("Output preview: %s...", output.raw[:200])
+    
+    # Log structured output if available
+    if output.pydantic:
+        logger.info(f"Structured output (Pydantic): {type(output.pydantic).__name__}")
         
-        # Validate MCP agent tool usage - check both tracked tools and output
-        if agent_id in ['market_analyst', 'non_ap_researcher']:
-            agent_tools = tracker.get_agent_tools().get(agent_id, [])
+        # Store query_analysis_task output in tracker for conditional task checks
+        if isinstance(output.pydantic, QueryAnalysis):
+            query_analysis = output.pydantic
             
-            # Also check output for tool information
-            ollama_tool_in_output = False
-            if hasattr(output, 'raw'):
-                try:
-                    import json
-                    raw_str = output.raw if isinstance(output.raw, str) else json.dumps(output.raw) if isinstance(output.raw, dict) else str(output.raw)
-                    if raw_str:
-                        raw_lower = raw_str.lower()
-                        ollama_tool_in_output = (
-                            'web_search' in raw_lower or 
-                            'web_fetch' in raw_lower or
-                            'ollama' in raw_lower or
-                            'ollama web search' in raw_lower
-                        )
-                        if ollama_tool_in_output:
-                            logger.info(f"✓ {agent_id}: Found Ollama Web Search MCP references in output (tool may have been used)")
-                except Exception as e:
-                    logger.debug(f"Could not check output for Ollama Web Search MCP references: {e}")
+            # Validate query_analysis before storing
+            required_agents = getattr(query_analysis, 'required_agents', [])
+            query_type = getattr(query_analysis, 'query_type', '')
+            original_query = getattr(query_analysis, 'original_query', '')
             
-            # Check if any Ollama Web Search MCP tools were actually used (not just tracked as available)
-            ollama_tool_used = any(
-                'ollama' in tool.lower() or 
-                'web_search' in tool.lower() or
-                'web_fetch' in tool.lower() or
-                'ollama web search' in tool.lower()
-                for tool in agent_tools
-            )
+            # Validate required_agents is a list
+            if not isinstance(required_agents, list):
+                logger.warning(f"query_analysis.required_agents is not a list: {type(required_agents)}. Converting to list.")
+                if required_agents is None:
+                    required_agents = []
+                elif isinstance(required_agents, tuple):
+                    required_agents = list(required_agents)
+                else:
+                    # A single agent id (strings are not split into characters)
+                    required_agents = [required_agents]
+                # Update the query_analysis object
+                query_analysis.required_agents = required_agents
             
-            if not ollama_tool_used and not ollama_tool_in_output:
-                logger.warning(f"⚠️ {agent_id}: Task completed but Ollama Web Search MCP tools do NOT appear to have been called!")
-                logger.warning(f"  Tracked tools: {agent_tools if agent_tools else 'None'}")
-                logger.warning(f"  The agent MUST use Ollama Web Search MCP tools for real-time data.")
-                logger.warning(f"  Please verify that OLLAMA_API_KEY is set and MCP server is accessible.")
-            elif ollama_tool_used:
-                logger.info(f"✓ {agent_id}: Ollama Web Search MCP tools were tracked as used: {[t for t in agent_tools if 'ollama' in t.lower() or 'web_search' in t.lower() or 'web_fetch' in t.lower()]}")
-            elif ollama_tool_in_output:
-                logger.info(f"✓ {agent_id}: Ollama Web Search MCP tool usage detected in output (may not have been tracked in step_callback)")
-            elif not agent_tools:
-                logger.warning(f"⚠️ {agent_id}: No tools tracked - Ollama Web Search MCP tools may not be available or were not used!")
-        
-        # Try to extract tools from task output if available
-        # Some CrewAI versions store tool usage in output
-        tools_tracked_from_output = False
-        if hasattr(output, 'tool_calls') and output.tool_calls:
-            logger.info(f"Found tools in task output: {output.tool_calls}")
-            for tool_call in output.tool_calls:
-                tool_name = None
-                if isinstance(tool_call, dict):
-                    tool_name = tool_call.get('tool') or tool_call.get('name')
-                elif hasattr(tool_call, 'tool'):
-                    tool_obj = tool_call.tool
-                    tool_name = getattr(tool_obj, 'name', None) or getattr(tool_obj, '__name__', None)
-                elif hasattr(tool_call, 'name'):
-                    tool_name = tool_call.name
-                
-                if tool_name:
-                    clean_tool_name = get_tool_display_name(tool_name)
-                    tracker.track_tool(agent_id, clean_tool_name)
-                    tools_tracked_from_output = True
-                    logger.info(f"✓ Tracked tool from task output: {clean_tool_name} for agent: {agent_id}")
-        
-        # FALLBACK: If no tools tracked from output, check if agent has tools assigned
-        # This ensures tools are displayed in the frontend even if CrewAI doesn't report usage
-        if not tools_tracked_from_output:
-            # Try to get agent from output if available
-            agent_from_output = None
-            if hasattr(output, 'agent'):
-                agent_from_output = output.agent
-            elif hasattr(output, 'agent_role'):
-                # Try to find agent by role
-                from policy_navigator.crew import PolicyNavigatorCrew
-                crew_instance = PolicyNavigatorCrew()
-                # This is a bit hacky, but we need to get the agent object
-                # For now, we'll use the agent_id to determine expected tools
-                pass
+            # Log query_analysis details for debugging
+            logger.info(f"📊 Query Analysis stored:")
+            logger.info(f"   - Query: {original_query[:100]}...")
+            logger.info(f"   - Query Type: {query_type}")
+            logger.info(f"   - Required Agents: {required_agents}")
+            logger.info(f"   - Region Type: {getattr(query_analysis, 'region_type', 'unknown')}")
+            logger.info(f"   - Is AP Query: {getattr(query_analysis, 'is_ap_query', 'unknown')}")
+            logger.info(f"   - Is Out of Scope: {getattr(query_analysis, 'is_out_of_scope', False)}")
             
-            # If we can't get agent object, use agent_id to determine expected tools
-            # This is a fallback to ensure tools are shown in UI
-            if agent_id:
-                # Map agent IDs to their expected tool display names (as shown in UI)
-                # These are the standardized display names from tool_mappings
-                expected_tools_map = {
-                    'query_analyzer': ['Region Detector'],
-                    'policy_researcher': ['RAG Document Search'],
-                    'crop_specialist': ['RAG Document Search'],
-                    'pest_advisor': ['RAG Document Search'],
-                    'market_analyst': ['Ollama Web Search MCP'],  # MCP tools
-                    'non_ap_researcher': ['Ollama Web Search MCP'],
-                    'pdf_processor_agent': ['PDF Processor (MCP)'],
-                    'calculator_agent': ['Calculator (ADK)'],  # ADK agent
-                    'response_synthesizer': []
-                }
-                
-                # Check if we've already tracked tools for this agent
-                existing_tools = tracker.get_agent_tools().get(agent_id, [])
-                if not existing_tools:
-                    expected_tools = expected_tools_map.get(agent_id, [])
-                    if expected_tools:
-                        logger.info(f"Fallback: Tracking expected tools for {agent_id}: {expected_tools}")
-                        # Track the expected tool directly (already in display name format)
-                        for tool_display_name in expected_tools:
-                            tracker.track_tool(agent_id, tool_display_name)
-                            logger.info(f"✓ Tracked expected tool (fallback): {tool_display_name} for agent: {agent_id}")
-        
-        # Log output summary
-        if output.raw:
-            output_length = len(output.raw)
-            logger.info(f"Output length: {output_length} characters")
-            logger.debug(f"Output preview: {output.raw[:200]}...")
-        
-        # Log structured output if available
-        if output.pydantic:
-            logger.info(f"Structured output (Pydantic): {type(output.pydantic).__name__}")
+            # Validate that required_agents includes response_synthesizer
+            if "response_synthesizer" not in required_agents:
+                logger.warning(f"⚠️  WARNING: response_synthesizer not in required_agents: {required_agents}")
+                logger.warning(f"   Adding response_synthesizer to required_agents")
+                required_agents.append("response_synthesizer")
+                query_analysis.required_agents = required_agents
             
-            # Store query_analysis_task output in tracker for conditional task checks
-            if isinstance(output.pydantic, QueryAnalysis):
-                query_analysis = output.pydantic
-                
-                # Validate query_analysis before storing
-                required_agents = getattr(query_analysis, 'required_agents', [])
-                query_type = getattr(query_analysis, 'query_type', '')
-                original_query = getattr(query_analysis, 'original_query', '')
-                
-                # Validate required_agents is a list
-                if not isinstance(required_agents, list):
-                    logger.warning(f"query_analysis.required_agents is not a list: {type(required_agents)}. Converting to list.")
-                    if required_agents is None:
-                        required_agents = []
-                    else:
-                        required_agents = [required_agents] if not isinstance(required_agents, (list, tuple)) else list(required_agents)
-                    # Update the query_analysis object
-                    query_analysis.required_agents = required_agents
-                
-                # Log query_analysis details for debugging
-                logger.info(f"📊 Query Analysis stored:")
-                logger.info(f"   - Query: {original_query[:100]}...")
-                logger.info(f"   - Query Type: {query_type}")
-                logger.info(f"   - Required Agents: {required_agents}")
-                logger.info(f"   - Region Type: {getattr(query_analysis, 'region_type', 'unknown')}")
-                logger.info(f"   - Is AP Query: {getattr(query_analysis, 'is_ap_query', 'unknown')}")
-                logger.info(f"   - Is Out of Scope: {getattr(query_analysis, 'is_out_of_scope', False)}")
-                
-                # Validate that required_agents includes response_synthesizer
-                if "response_synthesizer" not in required_agents:
-                    logger.warning(f"⚠️  WARNING: response_synthesizer not in required_agents: {required_agents}")
-                    logger.warning(f"   Adding response_synthesizer to required_agents")
-                    required_agents.append("response_synthesizer")
-                    query_analysis.required_agents = required_agents
-                
-                # Store validated query_analysis
-                tracker.store_query_analysis(query_analysis)
-                logger.info(f"✅ Stored query_analysis in tracker for conditional task checks")
-                logger.debug(f"   Tracker now has query_analysis: {tracker.query_analysis is not None}")
-        
-        if output.json_dict:
-            logger.debug(f"JSON output available with {len(output.json_dict)} fields")
-        
-        # Log execution summary
-        if hasattr(output, 'summary'):
-            logger.info(f"Task summary: {output.summary}")
-        
-        # Guardrail Validation Tracking
-        # Check if guardrail validation was performed
-        if hasattr(output, 'guardrail_result'):
-            guardrail_result = output.guardrail_result
-            if guardrail_result:
-                if hasattr(guardrail_result, 'valid'):
-                    is_valid = guardrail_result.valid
-                    if is_valid:
-                        logger.info(f"✓ Guardrail validation PASSED for task: {task_desc[:50]}")
-                    else:
-                        feedback = getattr(guardrail_result, 'feedback', 'Validation failed')
-                        logger.warning(f"⚠ Guardrail validation FAILED for task: {task_desc[:50]}")
-                        logger.warning(f"  Feedback: {feedback}")
-                elif isinstance(guardrail_result, dict):
-                    is_valid = guardrail_result.get('valid', True)
-                    if is_valid:
-                        logger.info(f"✓ Guardrail validation PASSED for task: {task_desc[:50]}")
-                    else:
-                        feedback = guardrail_result.get('feedback', 'Validation failed')
-                        logger.warning(f"⚠ Guardrail validation FAILED for task: {task_desc[:50]}")
-                        logger.warning(f"  Feedback: {feedback}")
-        
-        # Check for guardrail-related errors in output
-        if hasattr(output, 'error') and output.error:
-            error_str = str(output.error).lower()
-            if 'guardrail' in error_str or 'hallucination' in error_str or 'validation' in error_str:
-                logger.warning(f"⚠ Guardrail-related error in task: {task_desc[:50]}")
-                logger.warning(f"  Error: {output.error}")
-        
-        # A2A Communication: Store task output in StateManager for ADK agents
-        state_manager = get_state_manager()
-        
-        # Extract agent ID from agent_role or task description
-        agent_id = agent_role.lower().replace(' ', '_') if agent_role else 'unknown_agent'
-        
-        # Store task output in state
-        task_output_data = {
-            "raw": output.raw if output.raw else "",
-            "pydantic": output.pydantic.model_dump() if output.pydantic else None,
-            "json_dict": output.json_dict if output.json_dict else {},
-            "description": output.description if output.description else "",
+            # Store validated query_analysis
+            tracker.store_query_analysis(query_analysis)
+            logger.info(f"✅ Stored query_analysis in tracker for conditional task checks")
+            logger.debug("   Tracker now has query_analysis: %s", tracker.query_analysis is not None)
+    
+    if output.json_dict:
+        logger.debug("JSON output available with %d fields", len(output.json_dict))
+    
+    # Log execution summary
+    summary = getattr(output, 'summary', _MISSING)
+    if summary is not _MISSING:
+        logger.info(f"Task summary: {summary}")
+    
+    # Guardrail Validation Tracking
+    # Check if guardrail validation was performed
+    guardrail_result = getattr(output, 'guardrail_result', None)
+    if guardrail_result:
+        is_valid = getattr(guardrail_result, 'valid', _MISSING)
+        if is_valid is not _MISSING:
+            if is_valid:
+                logger.info(f"✓ Guardrail validation PASSED for task: {task_desc[:50]}")
+            else:
+                feedback = getattr(guardrail_result, 'feedback', 'Validation failed')
+                logger.warning(f"⚠ Guardrail validation FAILED for task: {task_desc[:50]}")
+                logger.warning(f"  Feedback: {feedback}")
+        elif isinstance(guardrail_result, dict):
+            is_valid = guardrail_result.get('valid', True)
+            if is_valid:
+                logger.info(f"✓ Guardrail validation PASSED for task: {task_desc[:50]}")
+            else:
+                feedback = guardrail_result.get('feedback', 'Validation failed')
+                logger.warning(f"⚠ Guardrail validation FAILED for task: {task_desc[:50]}")
+                logger.warning(f"  Feedback: {feedback}")
+    
+    # Check for guardrail-related errors in output
+    output_error = getattr(output, 'error', None)
+    if output_error:
+        error_str = str(output_error).lower()
+        if 'guardrail' in error_str or 'hallucination' in error_str or 'validation' in error_str:
+            logger.warning(f"⚠ Guardrail-related error in task: {task_desc[:50]}")
+            logger.warning(f"  Error: {output_error}")
+    
+    # A2A Communication: Store task output in StateManager for ADK agents
+    state_manager = get_state_manager()
+    
+    # Extract agent ID from agent_role or task description
+    agent_id = agent_role.lower().replace(' ', '_') if agent_role else 'unknown_agent'
+    
+    # Store task output in state. A model that fails to serialize should not
+    # keep the rest of the output from reaching the ADK agents
+    pydantic_data = None
+    if output.pydantic:
+        try:
+            pydantic_data = output.pydantic.model_dump()
+        except Exception as e:
+            logger.warning(f"Could not serialize structured output for StateManager: {e}")
+    task_output_data = {
+        "raw": output.raw if output.raw else "",
+        "pydantic": pydantic_data,
+        "json_dict": output.json_dict if output.json_dict else {},
+        "description": output.description if output.description else "",
+        "agent": agent_role
+    }
+    
+    state_manager.update_state(f"{agent_id}_output", task_output_data)
+    logger.info(f"✓ Stored task output in StateManager for A2A communication (Agent: {agent_id})")
+    
+    # Create A2A message for ADK agents (A2A Protocol)
+    a2a_message = A2AMessage(
+        from_agent=agent_id,
+        to_agent="adk_agents",  # Broadcast to all ADK agents (A2A pattern)
+        message_type="task_completion",
+        content={
+            "task_description": task_desc,
+            "output": task_output_data,
             "agent": agent_role
-        }
-        
-        state_manager.update_state(f"{agent_id}_output", task_output_data)
-        logger.info(f"✓ Stored task output in StateManager for A2A communication (Agent: {agent_id})")
-        
-        # Create A2A message for ADK agents (A2A Protocol)
-        import uuid
-        a2a_message = A2AMessage(
-            from_agent=agent_id,
-            to_agent="adk_agents",  # Broadcast to all ADK agents (A2A pattern)
-            message_type="task_completion",
-            content={
-                "task_description": task_desc,
-                "output": task_output_data,
-                "agent": agent_role
-            },
-            timestamp=datetime.now().isoformat(),
-            conversation_id=str(uuid.uuid4()),  # Track this conversation
-            status="completed",
-            capabilities=None,  # CrewAI agents don't expose capabilities in this context
-            response_required=False
+        },
+        timestamp=datetime.now().isoformat(),
+        conversation_id=str(uuid.uuid4()),  # Track this conversation
+        status="completed",
+        capabilities=None,  # CrewAI agents don't expose capabilities in this context
+        response_required=False
+    )
+    
+    state_manager.add_message(a2a_message)
+    logger.info(f"✓ Created A2A message from CrewAI agent '{agent_id}' to ADK agents (A2A Protocol)")
+    if debug_enabled:
+        logger.debug(
+            "A2A Message Details: type=%s, from=%s, to=%s, status=%s, conversation_id=%s",
+            a2a_message.message_type, a2a_message.from_agent, a2a_message.to_agent,
+            a2a_message.status, a2a_message.conversation_id
         )
-        
-        state_manager.add_message(a2a_message)
-        logger.info(f"✓ Created A2A message from CrewAI agent '{agent_id}' to ADK agents (A2A Protocol)")
-        logger.debug(f"A2A Message Details: type={a2a_message.message_type}, from={a2a_message.from_agent}, to={a2a_message.to_agent}, status={a2a_message.status}, conversation_id={a2a_message.conversation_id}")
-            
+
+
+def task_callback(output: TaskOutput) -> None:
+    """
+    Callback function called after the completion of each task
+    Also stores task outputs in StateManager for ADK agent access (A2A communication)
+    
+    Args:
+        output: TaskOutput object containing task results
+    """
+    try:
+        _record_task_output(output)
     except Exception as e:
+        # Monitoring must never fail the task it observes
         logger.error(f"Error in task_callback: {e}")
 
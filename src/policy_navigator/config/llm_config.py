@@ -6,11 +6,34 @@ Supports PRIMARY_LLM_PROVIDER/MODEL and FALLBACK_LLM_PROVIDER/MODEL
 
 import os
 import logging
+from collections import namedtuple
+from functools import lru_cache
 from typing import Optional, Tuple
 from crewai import LLM
 
 logger = logging.getLogger(__name__)
 
+# LLM settings read from the environment: primary and fallback are
+# (provider lowercased, model) pairs of stripped strings, '' when unset
+_LLMEnv = namedtuple('_LLMEnv', ['primary', 'fallback', 'openai_key', 'groq_key'])
+
+
+@lru_cache(maxsize=1)
+def _llm_env() -> _LLMEnv:
+    """Read the LLM environment variables once (see reload_llm_env)"""
+    return _LLMEnv(
+        primary=(os.getenv("PRIMARY_LLM_PROVIDER", "").strip().lower(), os.getenv("PRIMARY_LLM_MODEL", "").strip()),
+        fallback=(os.getenv("FALLBACK_LLM_PROVIDER", "").strip().lower(), os.getenv("FALLBACK_LLM_MODEL", "").strip()),
+        openai_key=os.getenv("OPENAI_API_KEY"),
+        groq_key=os.getenv("GROQ_API_KEY"),
+    )
+
+
+def reload_llm_env() -> None:
+    """Re-read the LLM environment variables on next use (e.g. after load_dotenv or in tests)"""
+    _llm_env.cache_clear()
+    get_llm_instance.cache_clear()
+
 
 def get_llm_provider_and_model(use_fallback: bool = False) -> Tuple[Optional[str], Optional[str]]:
     """
@@ -22,27 +45,30 @@ def get_llm_provider_and_model(use_fallback: bool = False) -> Tuple[Optional[str
     Returns:
         Tuple of (provider, model) or (None, None) if not configured
     """
+    env = _llm_env()
     if use_fallback:
-        provider = os.getenv("FALLBACK_LLM_PROVIDER", "").strip()
-        model = os.getenv("FALLBACK_LLM_MODEL", "").strip()
+        provider, model = env.fallback
         prefix = "FALLBACK"
     else:
-        provider = os.getenv("PRIMARY_LLM_PROVIDER", "").strip()
-        model = os.getenv("PRIMARY_LLM_MODEL", "").strip()
+        provider, model = env.primary
         prefix = "PRIMARY"
     
     if provider and model:
-        logger.debug(f"{prefix} LLM configured: provider={provider}, model={model}")
-        return provider.lower(), model
+        logger.debug("%s LLM configured: provider=%s, model=%s", prefix, provider, model)
+        return provider, model
     
-    logger.debug(f"{prefix} LLM not configured via environment variables")
+    logger.debug("%s LLM not configured via environment variables", prefix)
     return None, None
 
 
+@lru_cache(maxsize=4)
 def get_llm_instance(use_fallback: bool = False, default_model: Optional[str] = None) -> LLM:
     """
     Create LLM instance from environment variables
     
+    Instances are cached per (use_fallback, default_model) and shared by the
+    crew and the guardrails; LLM only holds configuration, not a connection.
+    
     Args:
         use_fallback: If True, use fallback LLM configuration
         default_model: Default model to use if no env vars configured (e.g., "gpt-4o-mini")
@@ -50,25 +76,26 @@ def get_llm_instance(use_fallback: bool = False, default_model: Optional[str] =
     Returns:
         LLM instance configured with provider and model from env vars
     """
-    provider, model = get_llm_provider_and_model(use_fallback=use_fallback)
-    
-    if provider and model:
+    env = _llm_env()
+    # Primary first (unless the fallback was asked for), then fallback when
+    # the primary provider's API key is missing
+    for fallback in ((True,) if use_fallback else (False, True)):
+        provider, model = get_llm_provider_and_model(use_fallback=fallback)
+        if not (provider and model):
+            break
+        
         # Get API keys based on provider
         api_key = None
+        key_name = None
         if provider == "openai":
-            api_key = os.getenv("OPENAI_API_KEY")
-            if not api_key:
-                logger.warning("OPENAI_API_KEY not found for PRIMARY LLM provider")
-                # Try fallback if primary not available
-                if not use_fallback:
-                    return get_llm_instance(use_fallback=True, default_model=default_model)
+            api_key, key_name = env.openai_key, "OPENAI_API_KEY"
         elif provider == "groq":
-            api_key = os.getenv("GROQ_API_KEY")
-            if not api_key:
-                logger.warning("GROQ_API_KEY not found for PRIMARY LLM provider")
-                # Try fallback if primary not available
-                if not use_fallback:
-                    return get_llm_instance(use_fallback=True, default_model=default_model)
+            api_key, key_name = env.groq_key, "GROQ_API_KEY"
+        if key_name and not api_key:
+            logger.warning("%s not found for %s LLM provider", key_name, "FALLBACK" if fallback else "PRIMARY")
+            # Try fallback if primary not available
+            if not fallback:
+                continue
         
         # Format model name based on provider
         formatted_model = model
@@ -90,8 +117,8 @@ def get_llm_instance(use_fallback: bool = False, default_model: Optional[str] =
         return LLM(model=default_model)
     
     # Try to auto-detect from available API keys
-    openai_key = os.getenv("OPENAI_API_KEY")
-    groq_key = os.getenv("GROQ_API_KEY")
+    openai_key = env.openai_key
+    groq_key = env.groq_key
     
     if openai_key:
         default = "gpt-4o-mini"
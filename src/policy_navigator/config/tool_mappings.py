@@ -3,6 +3,8 @@ Tool Name Mappings - Single Source of Truth
 Consolidates tool name mappings used across monitoring and orchestrator
 """
 
+from functools import lru_cache
+
 # Tool display name mapping - maps raw tool names to clean display names
 # This ensures consistency across monitoring callbacks and orchestrator
 TOOL_DISPLAY_NAMES = {
@@ -45,6 +47,8 @@ TOOL_DISPLAY_NAMES = {
     'ollama': 'Ollama Web Search MCP',
     'web_search': 'Ollama Web Search MCP',
     'web_fetch': 'Ollama Web Search MCP',
+    'web_search_many': 'Ollama Web Search MCP',
+    'web_fetch_many': 'Ollama Web Search MCP',
     'web search': 'Ollama Web Search MCP',
     'Web Search': 'Ollama Web Search MCP',
     
@@ -54,6 +58,9 @@ TOOL_DISPLAY_NAMES = {
     'read_pdf': 'PDF Processor (MCP)',
 }
 
+# Case-insensitive view of TOOL_DISPLAY_NAMES, built once at import
+_DISPLAY_NAMES_BY_LOWER = {name.lower(): display for name, display in TOOL_DISPLAY_NAMES.items()}
+
 # Tool framework mapping - identifies which tools are ADK-based
 # Used to determine A2A communication and framework usage requirements
 ADK_TOOLS = {
@@ -62,7 +69,9 @@ ADK_TOOLS = {
     'Agricultural Calculator ADK Tool',
 }
 
-# Helper function to get tool display name
+# Helper function to get tool display name (memoized: the set of raw tool
+# names seen in a run is small, and lookups happen on every step)
+@lru_cache(maxsize=512)
 def get_tool_display_name(tool_name: str) -> str:
     """
     Get standardized display name for a tool
@@ -76,16 +85,18 @@ def get_tool_display_name(tool_name: str) -> str:
     if not tool_name or tool_name == 'Unknown':
         return tool_name
     
-    # Check direct mapping first
-    if tool_name in TOOL_DISPLAY_NAMES:
-        return TOOL_DISPLAY_NAMES[tool_name]
+    # Check direct mapping first, then ignoring case
+    display_name = TOOL_DISPLAY_NAMES.get(tool_name) or _DISPLAY_NAMES_BY_LOWER.get(tool_name.lower())
+    if display_name:
+        return display_name
     
     # Clean common suffixes
     cleaned = tool_name.replace(' Tool', '').replace('_tool', '').replace('_', ' ')
     
     # Check if cleaned version exists
-    if cleaned in TOOL_DISPLAY_NAMES:
-        return TOOL_DISPLAY_NAMES[cleaned]
+    display_name = TOOL_DISPLAY_NAMES.get(cleaned) or _DISPLAY_NAMES_BY_LOWER.get(cleaned.lower())
+    if display_name:
+        return display_name
     
     # Return cleaned version if no mapping found
     return cleaned
@@ -101,6 +112,10 @@ def is_adk_tool(tool_name: str) -> bool:
     Returns:
         True if tool is ADK-based, False otherwise
     """
-    display_name = get_tool_display_name(tool_name)
-    return display_name in ADK_TOOLS or any(adk_name in tool_name for adk_name in ['ADK', 'adk'])
+    if not tool_name:
+        return False
+    # Cheap substring check first; only unmarked names need the display-name lookup
+    if 'ADK' in tool_name or 'adk' in tool_name:
+        return True
+    return get_tool_display_name(tool_name) in ADK_TOOLS
 
@@ -4,7 +4,7 @@ Document processor for loading and chunking agricultural documents
 
 import os
 from pathlib import Path
-from typing import List, Dict, Any
+from typing import List, Dict, Any, Iterator
 import PyPDF2
 from sentence_transformers import SentenceTransformer
 from policy_navigator.config.llm_config import get_embedding_model
@@ -144,8 +144,15 @@ class DocumentProcessor:
         Returns:
             List of all document chunks with metadata
         """
-        all_chunks = []
+        return list(self.iter_documents())
+    
+    def iter_documents(self) -> Iterator[Dict[str, Any]]:
+        """
+        Process documents in the data directory one file at a time
         
+        Yields:
+            Document chunks with metadata, in the same order as process_all_documents
+        """
         # Map folder names to categories
         category_mapping = {
             '01_Financial_Schemes': 'Financial Schemes',
@@ -176,8 +183,5 @@ class DocumentProcessor:
             # Process all files in the folder
             for file_path in folder_path.iterdir():
                 if file_path.is_file() and file_path.suffix.lower() in ['.pdf', '.txt']:
-                    chunks = self.process_document(file_path, category)
-                    all_chunks.extend(chunks)
-        
-        return all_chunks
+                    yield from self.process_document(file_path, category)
 
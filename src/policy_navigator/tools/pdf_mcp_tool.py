@@ -3,8 +3,8 @@ PDF MCP Tool - CrewAI tool wrapper for PDF MCP Server
 Provides PDF reading capabilities via MCP protocol
 
 Supports two implementations:
-1. Legacy PyPDF2-based server (default, backward compatible)
-2. FastMCP pypdf-based extractor (optional, uses newer pypdf library)
+1. Legacy PDF MCP server (default, backward compatible)
+2. FastMCP PyMuPDF-based extractor (optional, Markdown output)
 """
 
 from pathlib import Path
@@ -42,8 +42,8 @@ def pdf_mcp_read_file(file_path: str) -> str:
     It provides comprehensive text extraction with page-by-page breakdown.
     
     Supports two implementations:
-    - Legacy PyPDF2-based (default, backward compatible)
-    - FastMCP pypdf-based (optional, set USE_FASTMCP_PDF=1 environment variable)
+    - Legacy PDF MCP server (default, backward compatible)
+    - FastMCP PyMuPDF-based (optional, set USE_FASTMCP_PDF=1 environment variable)
     
     Args:
         file_path: Path to the PDF file to read.
@@ -82,7 +82,7 @@ def pdf_mcp_read_file(file_path: str) -> str:
                 logger.warning(f"FastMCP extraction failed, falling back to legacy: {e}")
                 # Fall through to legacy implementation
         
-        # Legacy implementation using PyPDF2
+        # Legacy PDF MCP server implementation
         logger.debug("Using legacy PDF MCP server")
         mcp_server = get_pdf_mcp_server()
         result = mcp_server.read_file(file_path)